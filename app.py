@@ -1,56 +1,116 @@
 from flask import Flask, render_template, request, jsonify
 import asyncio
+import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from easy_slack import EasySlack, NotificationPriority, NotifySound
+from easy_slack.utils import eventloop
 
 
 app = Flask(__name__)
 
+MAX_WORKERS = int(os.getenv('EASY_SLACK_WORKERS', '4'))
 
-def run_slack_bot(email):
-    async def main():
-        slack = EasySlack()
-        print("Connecting to Slack...")
-        if not await slack.login(email):
-            print("Failed to connect!")
-            return
-
-        slack.notify_manager.create_profile(
-            name="manager_message1",
-            sound_type=NotifySound.URGENT,
-            title_template="Message from Manager",
-            message_template="{sender}: {content}",
-            priority=NotificationPriority.HIGH
-        )
-
-        slack.notify_manager.create_profile(
-            name="intern_message",
-            sound_type=NotifySound.MESSAGE,
-            title_template="",
-            message_template="",
-            priority=NotificationPriority.LOW
-        )
-
-        slack.when("message") \
-            .from_person("djmorganjr22@gmail.com") \
-            .with_priority(NotificationPriority.HIGH) \
-            .play_sound("manager_message1") \
-            .done()
-
-        slack.when("message") \
-            .from_person("dwaynemorgan2024@u.northwstern.edu") \
-            .with_priority(NotificationPriority.HIGH) \
-            .play_sound("intern_message") \
-            .done()
-
-        print("\nSetup complete!")
-        print("Will notify when your manager or intern messages:")
-        print("- Manager: Urgent sound + voice message")
-        print("- Intern: Simple notification sound only")
-        print("\nPress Ctrl+C to stop")
+# Single background event loop shared by every /connect request. Blocking
+# Slack calls made through to_thread run on a bounded pool.
+loop = eventloop.new_event_loop()
+executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='slack')
+loop.set_default_executor(executor)
+threading.Thread(target=loop.run_forever, daemon=True).start()
+app.config['LOOP'] = loop
+
+# Limits how many logins can be in progress at once
+_connect_slots = threading.BoundedSemaphore(MAX_WORKERS)
+
+# Connected EasySlack instances keyed by user email
+_slack_sessions = {}
+
+MANAGER_EMAIL = "djmorganjr22@gmail.com"
+INTERN_EMAIL = "dwaynemorgan2024@u.northwstern.edu"
+
+
+async def setup_slack_bot(email):
+    """Log in and register profiles/rules, returning the EasySlack instance or None"""
+    if email in _slack_sessions:
+        print(f"Already connected as {email}")
+        return None
+
+    # Claim the email before the first await so a second /connect backs off
+    _slack_sessions[email] = None
+    # Opening the database and probing screen readers block, keep them off the shared loop
+    slack = await asyncio.to_thread(EasySlack)
+    _slack_sessions[email] = slack
+    print("Connecting to Slack...")
+    if not await slack.login(email):
+        print("Failed to connect!")
+        _slack_sessions.pop(email, None)
+        return None
+
+    await asyncio.to_thread(
+        slack.notify_manager.create_profile,
+        name="manager_message1",
+        sound_type=NotifySound.URGENT,
+        title_template="Message from Manager",
+        message_template="{sender}: {content}",
+        priority=NotificationPriority.HIGH
+    )
+
+    await asyncio.to_thread(
+        slack.notify_manager.create_profile,
+        name="intern_message",
+        sound_type=NotifySound.MESSAGE,
+        title_template="",
+        message_template="",
+        priority=NotificationPriority.LOW
+    )
+
+    # Look both senders up concurrently, each is a blocking Slack API call
+    manager, intern = await asyncio.gather(
+        asyncio.to_thread(slack.get_user_by_email, MANAGER_EMAIL),
+        asyncio.to_thread(slack.get_user_by_email, INTERN_EMAIL)
+    )
+
+    # A failed lookup skips the rule; from_person(email) would retry it on the loop
+    with slack.rules_batch():
+        if manager:
+            slack.when("message") \
+                .from_person(manager['id']) \
+                .with_priority(NotificationPriority.HIGH) \
+                .play_sound("manager_message1") \
+                .done()
+        else:
+            print(f"Could not find manager {MANAGER_EMAIL}, skipping their rule")
+
+        if intern:
+            slack.when("message") \
+                .from_person(intern['id']) \
+                .with_priority(NotificationPriority.HIGH) \
+                .play_sound("intern_message") \
+                .done()
+        else:
+            print(f"Could not find intern {INTERN_EMAIL}, skipping their rule")
+
+    print("\nSetup complete!")
+    print("Will notify when your manager or intern messages:")
+    print("- Manager: Urgent sound + voice message")
+    print("- Intern: Simple notification sound only")
+    return slack
+
+async def run_slack_bot_async(email):
+    try:
+        slack = await setup_slack_bot(email)
+    except Exception:
+        _slack_sessions.pop(email, None)
+        raise
+    finally:
+        _connect_slots.release()
+
+    if slack is None:
+        return
+    try:
         await slack.start()
-    
-    asyncio.run(main())
+    finally:
+        _slack_sessions.pop(email, None)
 
 @app.route('/')
 def home():
@@ -59,9 +119,10 @@ def home():
 @app.route('/connect', methods=['POST'])
 def connect():
     email = request.form['email']
-    thread = threading.Thread(target=run_slack_bot, args=(email,))
-    thread.start()
+    if not _connect_slots.acquire(blocking=False):
+        return jsonify({'status': 'error', 'message': 'Too many connections in progress, try again shortly'}), 429
+    asyncio.run_coroutine_threadsafe(run_slack_bot_async(email), app.config['LOOP'])
     return jsonify({'status': 'success', 'message': f'Connecting to Slack with {email}'})
 
 if __name__ == "__main__":
-    app.run(debug=True)
+    app.run()
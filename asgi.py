@@ -0,0 +1,9 @@
+from asgiref.wsgi import WsgiToAsgi
+from app import app as flask_app
+
+# uvicorn asgi:app --http httptools --workers 1
+app = WsgiToAsgi(flask_app)
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, http="httptools", workers=1)
@@ -1,5 +1,5 @@
 from easy_slack import EasySlack, NotificationPriority, NotifySound, MessageType
-import asyncio
+from easy_slack.utils import eventloop
 
 async def main():
     slack = EasySlack()
@@ -18,11 +18,12 @@ async def main():
     )
 
     # Create rule for channel monitoring
-    slack.when("message") \
-        .in_channel("slacka11lytest") \
-        .with_priority(NotificationPriority.HIGH) \
-        .play_sound("channel_notification") \
-        .done()
+    with slack.rules_batch():
+        slack.when("message") \
+            .in_channel("slacka11lytest") \
+            .with_priority(NotificationPriority.HIGH) \
+            .play_sound("channel_notification") \
+            .done()
 
     print("\nSetup complete!")
     print("Will notify when messages appear in #slacka11lytest:")
@@ -34,6 +35,6 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        eventloop.run(main())
     except KeyboardInterrupt:
         print("\nShutting down...")
\ No newline at end of file
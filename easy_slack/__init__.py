@@ -1,4 +1,3 @@
-from .core.easy_slack import EasySlack
 from .core.models import NotificationPriority, MessageType, UserStatus, NotifySound
 
 __version__ = "0.1.0"
@@ -9,4 +8,12 @@ __all__ = [
     'MessageType',
     'UserStatus',
     'NotifySound'
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    # EasySlack pulls in the sound, status and accessibility subsystems, so
+    # only load it once something actually asks for it
+    if name == 'EasySlack':
+        from .core.easy_slack import EasySlack
+        return EasySlack
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
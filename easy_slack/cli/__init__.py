@@ -0,0 +1,14 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..core.easy_slack import EasySlack
+
+_slack_instance = None
+
+def get_slack() -> 'EasySlack':
+    """Return the EasySlack instance shared by all CLI commands in this process"""
+    global _slack_instance
+    if _slack_instance is None:
+        from ..core.easy_slack import EasySlack
+        _slack_instance = EasySlack()
+    return _slack_instance
@@ -4,12 +4,27 @@ from rich.console import Console
 from rich.table import Table
 from pathlib import Path
 import asyncio
-from ..core.easy_slack import EasySlack
+import functools
+from typing import TYPE_CHECKING
+from . import get_slack
 from ..core.models import NotifySound, NotificationPriority
 from ..utils.db import Database
 
+if TYPE_CHECKING:
+    from ..core.easy_slack import EasySlack
+
 console = Console()
 
+CONFIG_DIR = Path.home() / '.easy_slack'
+
+_NOTIFY_SOUND_CHOICES = tuple(s.value for s in NotifySound)
+
+@functools.lru_cache(maxsize=1)
+def _db() -> Database:
+    """Open the workspace database once per process"""
+    CONFIG_DIR.mkdir(exist_ok=True)
+    return Database(CONFIG_DIR / 'workspace.db')
+
 @click.group()
 def cli():
     """EasySlack Setup CLI"""
@@ -25,18 +40,14 @@ def cli():
 def setup(slack_token: str, app_token: str, user_token: str):
     """Initial setup of workspace"""
     try:
-        # Create config directory
-        config_dir = Path.home() / '.easy_slack'
-        config_dir.mkdir(exist_ok=True)
-        
         # Initialize database
-        db = Database(config_dir / 'workspace.db')
+        db = _db()
         
         # Save all tokens including user token
         db.save_tokens(slack_token, app_token, user_token)
         
         # Initialize EasySlack to test connection
-        slack = EasySlack(config_dir)
+        slack = get_slack()
         asyncio.run(test_connection(slack))
         
         console.print("[green]Setup completed successfully![/green]")
@@ -44,7 +55,7 @@ def setup(slack_token: str, app_token: str, user_token: str):
     except Exception as e:
         console.print(f"[red]Error during setup: {str(e)}[/red]")
 
-async def test_connection(slack: EasySlack) -> bool:
+async def test_connection(slack: 'EasySlack') -> bool:
     """Test Slack connection"""
     try:
         # Try to connect
@@ -61,8 +72,7 @@ async def test_connection(slack: EasySlack) -> bool:
 def add_admin(email: str):
     """Add workspace admin"""
     try:
-        config_dir = Path.home() / '.easy_slack'
-        db = Database(config_dir / 'workspace.db')
+        db = _db()
         
         admin_id = db.add_user(
             email=email,
@@ -79,25 +89,25 @@ def add_admin(email: str):
 def configure_notifications():
     """Configure default notification settings"""
     try:
-        slack = EasySlack()
+        slack = get_slack()
         
         # Get default settings
         settings = questionary.form(
             default_sound=questionary.select(
                 "Default notification sound:",
-                choices=[s.value for s in NotifySound]
+                choices=_NOTIFY_SOUND_CHOICES
             ),
             urgent_sound=questionary.select(
                 "Urgent notification sound:",
-                choices=[s.value for s in NotifySound]
+                choices=_NOTIFY_SOUND_CHOICES
             ),
             mention_sound=questionary.select(
                 "Mention notification sound:",
-                choices=[s.value for s in NotifySound]
+                choices=_NOTIFY_SOUND_CHOICES
             ),
             dm_sound=questionary.select(
                 "Direct message sound:",
-                choices=[s.value for s in NotifySound]
+                choices=_NOTIFY_SOUND_CHOICES
             )
         ).ask()
         
@@ -105,7 +115,7 @@ def configure_notifications():
             # Configure notification profiles
             slack.notify_manager.create_profile(
                 "default",
-                NotifySound(settings['default_sound']),
+                NotifySound.from_value(settings['default_sound']),
                 "Slack Message",
                 "New message received",
                 NotificationPriority.MEDIUM
@@ -113,7 +123,7 @@ def configure_notifications():
             
             slack.notify_manager.create_profile(
                 "urgent",
-                NotifySound(settings['urgent_sound']),
+                NotifySound.from_value(settings['urgent_sound']),
                 "Urgent Message",
                 "URGENT: {content}",
                 NotificationPriority.HIGH
@@ -121,7 +131,7 @@ def configure_notifications():
             
             slack.notify_manager.create_profile(
                 "mention",
-                NotifySound(settings['mention_sound']),
+                NotifySound.from_value(settings['mention_sound']),
                 "Mention",
                 "{sender} mentioned you",
                 NotificationPriority.HIGH
@@ -129,7 +139,7 @@ def configure_notifications():
             
             slack.notify_manager.create_profile(
                 "dm",
-                NotifySound(settings['dm_sound']),
+                NotifySound.from_value(settings['dm_sound']),
                 "Direct Message",
                 "DM from {sender}",
                 NotificationPriority.HIGH
@@ -144,8 +154,7 @@ def configure_notifications():
 def show_config():
     """Show current configuration"""
     try:
-        config_dir = Path.home() / '.easy_slack'
-        db = Database(config_dir / 'workspace.db')
+        db = _db()
         
         # Show workspace info
         console.print("\n[bold]Workspace Configuration[/bold]")
@@ -172,7 +181,7 @@ def show_config():
             
         # Show notification settings
         console.print("\n[bold]Notification Profiles[/bold]")
-        slack = EasySlack(config_dir)
+        slack = get_slack()
         profiles = slack.notify_manager.profiles
         
         if profiles:
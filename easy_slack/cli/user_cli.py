@@ -6,11 +6,15 @@ from pathlib import Path
 import asyncio
 import importlib.util
 import sys
-from ..core.easy_slack import EasySlack
+from . import get_slack
+from ..core.rules import RuleBuilder
 from ..core.models import UserStatus, NotificationPriority, NotifySound, MessageType
 
 console = Console()
 
+_NOTIFY_SOUND_CHOICES = tuple(s.value for s in NotifySound)
+_PRIORITY_CHOICES = tuple(p.value for p in NotificationPriority)
+
 @click.group()
 def cli():
     """EasySlack User CLI"""
@@ -21,7 +25,7 @@ def cli():
 def login(email: str):
     """Login to EasySlack"""
     try:
-        slack = EasySlack()
+        slack = get_slack()
         if asyncio.run(slack.login(email)):
             console.print("[green]Login successful[/green]")
         else:
@@ -64,30 +68,30 @@ def run_script(script_path: str):
 def create_notification():
     """Create a custom notification profile"""
     try:
-        slack = EasySlack()
+        slack = get_slack()
         
         # Get notification details
         answers = questionary.form(
             name=questionary.text("Profile name:"),
             sound=questionary.select(
                 "Notification sound:",
-                choices=[s.value for s in NotifySound]
+                choices=_NOTIFY_SOUND_CHOICES
             ),
             title=questionary.text("Notification title:"),
             message=questionary.text("Message template:"),
             priority=questionary.select(
                 "Priority:",
-                choices=[p.value for p in NotificationPriority]
+                choices=_PRIORITY_CHOICES
             )
         ).ask()
         
         if answers:
             success = slack.notify_manager.create_profile(
                 name=answers['name'],
-                sound_type=NotifySound(answers['sound']),
+                sound_type=NotifySound.from_value(answers['sound']),
                 title_template=answers['title'],
                 message_template=answers['message'],
-                priority=NotificationPriority(answers['priority'])
+                priority=NotificationPriority.from_value(answers['priority'])
             )
             
             if success:
@@ -98,11 +102,37 @@ def create_notification():
     except Exception as e:
         console.print(f"[red]Error creating notification: {str(e)}[/red]")
 
+def _build_from_person(slack, builder):
+    """Add a sender condition for a known user's email"""
+    who = questionary.text("Enter person's email:").ask()
+    user = slack.db.get_user_by_email(who)
+    if not user:
+        console.print("[red]User not found[/red]")
+        return None
+    return builder.from_person(user['id'])
+
+def _build_in_channel(slack, builder):
+    """Add a channel condition"""
+    channel = questionary.text("Enter channel name:").ask()
+    return builder.in_channel(channel)
+
+def _build_keyword(slack, builder):
+    """Add a content pattern condition"""
+    pattern = questionary.text("Enter keyword or pattern:").ask()
+    return builder.containing(pattern)
+
+# create_rule: rule key -> prompts for and adds the rule's condition
+_RULE_BUILDERS = {
+    "message_from_person": _build_from_person,
+    "message_in_channel": _build_in_channel,
+    "keyword": _build_keyword
+}
+
 @cli.command()
 def create_rule():
     """Create a new notification rule"""
     try:
-        slack = EasySlack()
+        slack = get_slack()
         
         # Get rule type
         rule_type = questionary.select(
@@ -119,34 +149,24 @@ def create_rule():
             return
             
         # Start building rule
-        builder = slack.when(rule_type.lower().replace(" ", "_"))
+        rule_key = rule_type.lower().replace(" ", "_")
+        builder = slack.when(rule_key)
         
         # Get conditions based on type
-        if rule_type == "Message from person":
-            who = questionary.text("Enter person's email:").ask()
-            user = slack.db.get_user_by_email(who)
-            if user:
-                builder = builder.from_person(user['id'])
-            else:
-                console.print("[red]User not found[/red]")
+        add_condition = _RULE_BUILDERS.get(rule_key)
+        if add_condition:
+            builder = add_condition(slack, builder)
+            if builder is None:
                 return
-                
-        elif rule_type == "Message in channel":
-            channel = questionary.text("Enter channel name:").ask()
-            builder = builder.in_channel(channel)
-            
-        elif rule_type == "Keyword":
-            pattern = questionary.text("Enter keyword or pattern:").ask()
-            builder = builder.containing(pattern)
         
         # Get priority
         priority = questionary.select(
             "Select priority:",
-            choices=[p.value for p in NotificationPriority]
+            choices=_PRIORITY_CHOICES
         ).ask()
         
         if priority:
-            builder = builder.with_priority(NotificationPriority(priority))
+            builder = builder.with_priority(NotificationPriority.from_value(priority))
         
         # Get actions
         while True:
@@ -160,7 +180,7 @@ def create_rule():
                 
             if action == "Play sound":
                 # Show available profiles
-                profiles = list(slack.notify_manager.profiles.keys())
+                profiles = slack.notify_manager.profile_names
                 profile = questionary.select(
                     "Select notification profile:",
                     choices=profiles
@@ -187,7 +207,7 @@ def create_rule():
 def set_status():
     """Set user status"""
     try:
-        slack = EasySlack()
+        slack = get_slack()
         
         status = questionary.select(
             "Select status:",
@@ -205,7 +225,7 @@ def set_status():
 def manage_exceptions():
     """Manage notification exceptions"""
     try:
-        slack = EasySlack()
+        slack = get_slack()
         
         action = questionary.select(
             "What would you like to do?",
@@ -243,8 +263,9 @@ def manage_exceptions():
                 table.add_column("User ID")
                 table.add_column("Name")
                 
+                users = slack.db.get_users_by_slack_ids(exceptions)
                 for user_id in exceptions:
-                    user = slack.db.get_user_by_slack_id(user_id)
+                    user = users.get(user_id)
                     if user:
                         table.add_row(user_id, user['name'])
                         
@@ -259,7 +280,7 @@ def manage_exceptions():
 def list_rules():
     """List all notification rules"""
     try:
-        slack = EasySlack()
+        slack = get_slack()
         rules = slack.rule_engine.rules
         
         if rules:
@@ -293,7 +314,7 @@ def list_rules():
 def start():
     """Start EasySlack"""
     try:
-        slack = EasySlack()
+        slack = get_slack()
         console.print("[green]Starting EasySlack...[/green]")
         asyncio.run(slack.start())
     except KeyboardInterrupt:
@@ -306,11 +327,30 @@ def rules():
     """Manage notification rules"""
     pass
 
+# rules add: rule type -> (prompt, condition method, summary)
+_RULE_CONDITIONS = {
+    "Message from person": (
+        "Enter person's email:",
+        RuleBuilder.from_person,
+        "Notifications for messages from {}"
+    ),
+    "Message in channel": (
+        "Enter channel name:",
+        RuleBuilder.in_channel,
+        "Notifications for messages in #{}"
+    ),
+    "Keyword in message": (
+        "Enter keyword or pattern:",
+        RuleBuilder.containing,
+        "Notifications for messages containing '{}'"
+    )
+}
+
 @rules.command()
 def add():
     """Add a new notification rule"""
     try:
-        slack = EasySlack()
+        slack = get_slack()
         
         # Get rule type
         rule_type = questionary.select(
@@ -322,54 +362,25 @@ def add():
             ]
         ).ask()
         
-        if rule_type == "Message from person":
-            email = questionary.text("Enter person's email:").ask()
-            name = questionary.text("Give this rule a name:").ask()
-            priority = questionary.select(
-                "Select priority:",
-                choices=["LOW", "MEDIUM", "HIGH", "CRITICAL"]
-            ).ask()
-            
-            slack.when("message") \
-                .from_person(email) \
-                .with_priority(NotificationPriority[priority]) \
-                .play_sound("default") \
-                .done()
-                
-            print(f"Rule created: Notifications for messages from {email}")
-            
-        elif rule_type == "Message in channel":
-            channel = questionary.text("Enter channel name:").ask()
-            name = questionary.text("Give this rule a name:").ask()
-            priority = questionary.select(
-                "Select priority:",
-                choices=["LOW", "MEDIUM", "HIGH", "CRITICAL"]
-            ).ask()
-            
-            slack.when("message") \
-                .in_channel(channel) \
-                .with_priority(NotificationPriority[priority]) \
-                .play_sound("default") \
-                .done()
-                
-            print(f"Rule created: Notifications for messages in #{channel}")
-            
-        elif rule_type == "Keyword in message":
-            keyword = questionary.text("Enter keyword or pattern:").ask()
-            name = questionary.text("Give this rule a name:").ask()
-            priority = questionary.select(
-                "Select priority:",
-                choices=["LOW", "MEDIUM", "HIGH", "CRITICAL"]
-            ).ask()
-            
-            slack.when("message") \
-                .containing(keyword) \
-                .with_priority(NotificationPriority[priority]) \
-                .play_sound("default") \
-                .done()
-                
-            print(f"Rule created: Notifications for messages containing '{keyword}'")
-            
+        condition = _RULE_CONDITIONS.get(rule_type)
+        if not condition:
+            return
+
+        prompt, add_condition, summary = condition
+        value = questionary.text(prompt).ask()
+        name = questionary.text("Give this rule a name:").ask()
+        priority = questionary.select(
+            "Select priority:",
+            choices=["LOW", "MEDIUM", "HIGH", "CRITICAL"]
+        ).ask()
+
+        add_condition(slack.when("message"), value) \
+            .with_priority(NotificationPriority[priority]) \
+            .play_sound("default") \
+            .done()
+
+        print(f"Rule created: {summary.format(value)}")
+
     except Exception as e:
         print(f"Error creating rule: {e}")
 
@@ -377,9 +388,9 @@ def add():
 def list():
     """List all notification rules"""
     try:
-        slack = EasySlack()
+        slack = get_slack()
         # Directly get rules from database, no login needed
-        rules = slack.db.get_rules()
+        rules = slack.db.get_rules_bulk()
         
         if not rules:
             console.print("[yellow]No rules configured[/yellow]")
@@ -393,14 +404,13 @@ def list():
         table.add_column("Priority", style="yellow")
         table.add_column("Status", style="blue")
         
-        for rule in rules:
-            conditions = rule.get('conditions', {})
+        for name, rule_type, conditions, priority, enabled in rules:
             table.add_row(
-                rule.get('name', 'Unknown'),
-                next(iter(conditions.keys()), "any"),
-                ", ".join(f"{k}={v}" for k, v in conditions.items()),
-                rule.get('priority', 'UNKNOWN'),
-                "✓ Enabled" if rule.get('enabled', False) else "✗ Disabled"
+                name,
+                rule_type,
+                conditions,
+                priority,
+                "✓ Enabled" if enabled else "✗ Disabled"
             )
             
         console.print("\n[bold]Current Notification Rules:[/bold]")
@@ -413,7 +423,7 @@ def list():
 def delete():
     """Delete a notification rule"""
     try:
-        slack = EasySlack()
+        slack = get_slack()
         rules = slack.rule_engine.rules
         
         if not rules:
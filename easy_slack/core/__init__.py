@@ -1,46 +1,44 @@
-from .models import (
-    Message,
-    MessageType,
-    UserStatus,
-    NotificationPriority,
-    NotifySound,
-    NotificationProfile,
-    NotificationRule,
-    UserPreferences,
-    NotificationBuffer
-)
-
-from .easy_slack import EasySlack
-from .rules import RuleEngine, RuleBuilder
-from .sound_management import NotificationManager
-from .status import StatusManager
-from .accessibility import AccessibilityManager, ScreenReader
+from importlib import import_module
 
-# Version info
-__version__ = "0.1.0"
-
-__all__ = [
+# Exported name -> submodule it lives in, imported on first access
+_LAZY_EXPORTS = {
     # Core class
-    "EasySlack",
-    
+    "EasySlack": ".easy_slack",
+
     # Managers
-    "RuleEngine",
-    "RuleBuilder",
-    "NotificationManager",
-    "StatusManager",
-    "AccessibilityManager",
-    
+    "RuleEngine": ".rules",
+    "RuleBuilder": ".rules",
+    "NotificationManager": ".sound_management",
+    "StatusManager": ".status",
+    "AccessibilityManager": ".accessibility",
+
     # Models
-    "Message",
-    "MessageType",
-    "UserStatus",
-    "NotificationPriority",
-    "NotifySound",
-    "NotificationProfile",
-    "NotificationRule",
-    "UserPreferences",
-    "NotificationBuffer",
-    
+    "Message": ".models",
+    "MessageType": ".models",
+    "UserStatus": ".models",
+    "NotificationPriority": ".models",
+    "NotifySound": ".models",
+    "NotificationProfile": ".models",
+    "NotificationRule": ".models",
+    "UserPreferences": ".models",
+    "NotificationBuffer": ".models",
+
     # Enums
-    "ScreenReader",
-]
\ No newline at end of file
+    "ScreenReader": ".accessibility",
+}
+
+# Version info
+__version__ = "0.1.0"
+
+__all__ = list(_LAZY_EXPORTS)
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
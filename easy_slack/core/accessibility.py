@@ -1,48 +1,195 @@
+import os
+import importlib
 import platform
 import subprocess
 import logging
-from typing import Optional, Dict, Any
+import time
+import threading
+import queue
+from typing import Optional, Dict, Any, Tuple, List, Callable
 from .models import ScreenReader  
 from ..core.models import NotifySound
 #from models import NotifySound
+
+# PyObjC lets macOS detection and speech run in-process instead of via osascript
+try:
+    from AppKit import (
+        NSWorkspace,
+        NSSpeechSynthesizer,
+        NSSound
+    )
+except ImportError:
+    NSWorkspace = NSSpeechSynthesizer = NSSound = None
+
+try:
+    from Foundation import CFPreferencesCopyAppValue
+except ImportError:
+    CFPreferencesCopyAppValue = None
+
+VOICEOVER_BUNDLE_ID = "com.apple.VoiceOver"
+
+DETECTION_TTL = 60.0  # Seconds a screen reader detection result stays valid
+ANNOUNCE_COALESCE_DEPTH = 3  # Backlog size at which messages from one sender are merged
+
+# Map NotifySound types to system sounds
+_VO_SOUND_FILES = {
+    NotifySound.MESSAGE: "Morse.aiff",    # Basic notification
+    NotifySound.MENTION: "Ping.aiff",     # When mentioned
+    NotifySound.DM: "Purr.aiff",         # Direct messages
+    NotifySound.URGENT: "Glass.aiff",     # Urgent/important
+    NotifySound.SUCCESS: "Bottle.aiff",   # Success events
+    NotifySound.WARNING: "Basso.aiff"     # Warning events
+}
+
+# os_type -> (detected_at, screen reader), shared by every AccessibilityManager
+_detection_cache: Dict[str, Tuple[float, ScreenReader]] = {}
+
+def _applescript_string(text: str) -> str:
+    """Escape text for a one-line AppleScript string literal"""
+    return (text.replace('\\', '\\\\')
+                .replace('"', '\\"')
+                .replace('\r', ' ')
+                .replace('\n', ' '))
+
+def _reject(settings: Dict[str, Any]) -> bool:
+    """Validator for screen readers without configurable settings"""
+    return False
+
+def _settings_validator(supported: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """Build a validator for one screen reader's supported settings"""
+    ranges = {key: allowed for key, allowed in supported.items() if isinstance(allowed, tuple)}
+    choices = {key: allowed for key, allowed in supported.items() if not isinstance(allowed, tuple)}
+
+    def validate(settings: Dict[str, Any]) -> bool:
+        for key, value in settings.items():
+            bounds = ranges.get(key)
+            if bounds is not None:
+                if not isinstance(value, int) or not bounds[0] <= value <= bounds[1]:
+                    return False
+            elif key not in choices or value not in choices[key]:
+                return False
+        return True
+
+    return validate
+
 class AccessibilityManager:
     """Manages screen reader detection and notifications"""
+
+    # Supported settings for each screen reader: inclusive (lo, hi) bounds
+    # for numeric settings, frozensets of allowed values for the rest
+    SUPPORTED_SETTINGS = {
+        'voiceover': {
+            'voice': frozenset(['Alex', 'Victoria', 'Daniel']),  # Common VoiceOver voices
+            'rate': (100, 400),
+            'pitch': (0, 100),
+            'sound': frozenset(['Glass', 'Pop', 'Ping'])
+        },
+        'nvda': {
+            'voice': frozenset(['Microsoft David', 'Microsoft Zira']),
+            'rate': (0, 100),
+            'pitch': (0, 100),
+            'sound': frozenset([True, False])
+        },
+        'jaws': {
+            'voice': frozenset(['Microsoft David', 'Microsoft Zira']),  # Common JAWS voices
+            'rate': (0, 100),
+            'pitch': (0, 100),
+            'sound': frozenset(['MessageBeep', 'SystemAsterisk', 'SystemExclamation'])
+        },
+        'orca': {
+            'voice': frozenset(['default', 'english', 'spanish']),
+            'rate': (0, 100),
+            'pitch': (0, 100),
+            'sound': frozenset(['message-new-instant', 'message-new-email'])
+        }
+    }
+    supported_settings = SUPPORTED_SETTINGS
     
     def __init__(self):
         self.logger = logging.getLogger("AccessibilityManager")
         self.os_type = platform.system()
-        self.screen_reader = self._detect_screen_reader()
-        
-        # Define supported settings for each screen reader
-        self.supported_settings = {
-            'voiceover': {
-                'voice': ['Alex', 'Victoria', 'Daniel'],  # Common VoiceOver voices
-                'rate': range(100, 401),  
-                'pitch': range(0, 101),   
-                'sound': ['Glass', 'Pop', 'Ping'] 
-            },
-            'nvda': {
-                'voice': ['Microsoft David', 'Microsoft Zira'],  
-                'rate': range(0, 101),    
-                'pitch': range(0, 101), 
-                'sound': [True, False]    
-            },
-            'jaws': {
-                'voice': ['Microsoft David', 'Microsoft Zira'],  # Common JAWS voices
-                'rate': range(0, 101),    # 0-100
-                'pitch': range(0, 101),   # 0-100
-                'sound': ['MessageBeep', 'SystemAsterisk', 'SystemExclamation']
-            },
-            'orca': {
-                'voice': ['default', 'english', 'spanish'],
-                'rate': range(0, 101),    # 0-100
-                'pitch': range(0, 101),   # 0-100
-                'sound': ['message-new-instant', 'message-new-email']
-            }
+        # PyObjC probes VoiceOver in-process, cheap enough to repeat once the TTL lapses
+        self._live_detection = self.os_type == "Darwin" and NSWorkspace is not None
+        self._screen_reader = self._detect_screen_reader()
+
+        self._nsspeech = None
+        if self.os_type == "Darwin" and NSSpeechSynthesizer is not None:
+            self._nsspeech = NSSpeechSynthesizer.alloc().init()
+        self._nssounds: Dict[str, Any] = {}  # sound file -> loaded NSSound
+
+        # Long-lived `osascript -i` used when PyObjC is unavailable, started on first use
+        self._osa: Optional[subprocess.Popen] = None
+        self._osa_lock = threading.Lock()
+
+        # Windows screen reader APIs, loaded once for the detected reader
+        self._nvda = None
+        self._jaws = None
+        if self.screen_reader == ScreenReader.NVDA:
+            self._nvda = self._load_nvda()
+        elif self.screen_reader == ScreenReader.JAWS:
+            self._jaws = self._load_jaws()
+
+        # In-process sound and speech for Orca: (libcanberra, context) and an SSIP client
+        self._canberra = None
+        self._spd = None
+        if self.screen_reader == ScreenReader.ORCA:
+            self._canberra = self._load_canberra()
+            self._spd = self._load_speechd()
+
+        self._validators: Dict[ScreenReader, Callable[[Dict[str, Any]], bool]] = {
+            ScreenReader(sr_type): _settings_validator(supported)
+            for sr_type, supported in self.SUPPORTED_SETTINGS.items()
         }
 
+        # Sound/speech commands run in order on one background thread, so
+        # callers never wait on a child process
+        self._command_queue: "queue.Queue[List[str]]" = queue.Queue()
+        self._command_thread: Optional[threading.Thread] = None
+        self._command_lock = threading.Lock()
+
+        # Announcements wait for the previous one to finish speaking instead
+        # of cutting it off: (message, sound, sender, settings)
+        self._announce_queue: "queue.Queue[Tuple[str, bool, Optional[str], Dict[str, Any]]]" = queue.Queue()
+        self._announce_thread: Optional[threading.Thread] = None
+        self._warned_no_reader = False
+
+    @property
+    def screen_reader(self) -> ScreenReader:
+        """Detected screen reader, re-detected on macOS once the cached result expires"""
+        if self._live_detection:
+            self._screen_reader = self._detect_screen_reader()
+        return self._screen_reader
+
+    @screen_reader.setter
+    def screen_reader(self, value: ScreenReader):
+        self._screen_reader = value
+
+    @staticmethod
+    def invalidate_detection_cache():
+        """Forget cached detection results so the next lookup probes again"""
+        _detection_cache.clear()
+
     def _detect_screen_reader(self) -> ScreenReader:
-        """Detect active screen reader"""
+        """Detect active screen reader, reusing a recent result when there is one"""
+        cached = _detection_cache.get(self.os_type)
+        if cached and time.monotonic() - cached[0] < DETECTION_TTL:
+            return cached[1]
+
+        screen_reader = self._probe_screen_reader()
+        _detection_cache[self.os_type] = (time.monotonic(), screen_reader)
+        return screen_reader
+
+    def _probe_screen_reader(self) -> ScreenReader:
+        """Check the system for a running screen reader"""
+        if self.os_type == "Darwin" and NSWorkspace is not None:
+            try:
+                running = NSWorkspace.sharedWorkspace().runningApplications()
+                if any(app.bundleIdentifier() == VOICEOVER_BUNDLE_ID for app in running):
+                    return ScreenReader.VOICEOVER
+                return ScreenReader.NONE
+            except Exception as e:
+                self.logger.error(f"Error checking VoiceOver via NSWorkspace: {e}")
+
         if self.os_type == "Darwin":  # macOS
             try:
                 # Check if VoiceOver is running using different AppleScript
@@ -73,6 +220,24 @@ class AccessibilityManager:
                     self.logger.error(f"Error checking VoiceOver alternative: {e}")
                     
         elif self.os_type == "Windows":
+            # Both readers own a well-known top-level window, so one user32
+            # call each replaces listing every process
+            try:
+                import ctypes
+                find_window = ctypes.windll.user32.FindWindowW
+            except (ImportError, AttributeError):
+                find_window = None
+
+            if find_window is not None:
+                try:
+                    if find_window("wxWindowClassNR", "NVDA"):
+                        return ScreenReader.NVDA
+                    if find_window("JFWUI2", None):
+                        return ScreenReader.JAWS
+                except Exception as e:
+                    self.logger.error(f"Error checking Windows screen readers: {e}")
+                return ScreenReader.NONE
+
             # Check for NVDA or JAWS
             try:
                 result = subprocess.run(['tasklist'], capture_output=True, text=True)
@@ -86,40 +251,95 @@ class AccessibilityManager:
         elif self.os_type == "Linux":
             # Check for Orca
             try:
-                result = subprocess.run(['ps', 'aux'], capture_output=True, text=True)
-                if "orca" in result.stdout.lower():
+                if self._process_running("orca"):
                     return ScreenReader.ORCA
             except Exception as e:
                 self.logger.error(f"Error checking Orca: {e}")
                 
         return ScreenReader.NONE
 
+    @staticmethod
+    def _process_running(name: str) -> bool:
+        """Check /proc/<pid>/comm for a process with exactly this name"""
+        target = name + "\n"
+        with os.scandir('/proc') as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f'/proc/{entry.name}/comm') as f:
+                        if f.read() == target:
+                            return True
+                except OSError:
+                    continue  # Process exited or is not readable
+        return False
+
     def validate_settings(self, screen_reader: ScreenReader, settings: Dict[str, Any]) -> bool:
         """Validate settings for specific screen reader"""
-        sr_type = screen_reader.value
-        if sr_type not in self.supported_settings:
-            return False
-            
-        supported = self.supported_settings[sr_type]
-        try:
-            # Check each setting against supported values
-            for key, value in settings.items():
-                if key not in supported:
-                    return False
-                    
-                if key in ['rate', 'pitch']:
-                    if not isinstance(value, int) or value not in supported[key]:
-                        return False
-                elif key in ['voice', 'sound']:
-                    if value not in supported[key]:
-                        return False
-                        
-            return True
-        except Exception as e:
-            self.logger.error(f"Error validating settings: {e}")
-            return False
+        return self._validators.get(screen_reader, _reject)(settings)
+
+    def notify(self, message: str, sound: bool = True, sender: Optional[str] = None, **settings):
+        """Queue notification for the active screen reader"""
+        if self.screen_reader is ScreenReader.NONE:
+            if not self._warned_no_reader:
+                self.logger.warning("No screen reader detected")
+                self._warned_no_reader = True
+            return
+
+        with self._command_lock:
+            if self._announce_thread is None:
+                self._announce_thread = threading.Thread(
+                    target=self._announce_worker,
+                    daemon=True
+                )
+                self._announce_thread.start()
+        self._announce_queue.put((message, sound, sender, settings))
+
+    def _announce_worker(self):
+        """Speak queued notifications one at a time, merging a backlog per sender"""
+        while True:
+            batch = [self._announce_queue.get()]
+            if self._announce_queue.qsize() >= ANNOUNCE_COALESCE_DEPTH:
+                while True:
+                    try:
+                        batch.append(self._announce_queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+            for message, sound, settings in self._coalesce(batch):
+                self._announce(message, sound, **settings)
+                self._wait_for_speech()
+
+            for _ in batch:
+                self._announce_queue.task_done()
+
+    @staticmethod
+    def _coalesce(batch: List[Tuple[str, bool, Optional[str], Dict[str, Any]]]) -> List[Tuple[str, bool, Dict[str, Any]]]:
+        """Collapse several messages from one sender into a single announcement"""
+        counts: Dict[str, int] = {}
+        for _, _, sender, _ in batch:
+            if sender:
+                counts[sender] = counts.get(sender, 0) + 1
+
+        announcements = []
+        announced = set()
+        for message, sound, sender, settings in batch:
+            if sender and counts[sender] > 1:
+                if sender in announced:
+                    continue
+                announced.add(sender)
+                message = f"{counts[sender]} new messages from {sender}"
+            announcements.append((message, sound, settings))
+        return announcements
 
-    def notify(self, message: str, sound: bool = True, **settings):
+    def _wait_for_speech(self):
+        """Block until the current announcement has finished"""
+        self._command_queue.join()  # osascript / spd-say runs
+        if self._nsspeech is not None:
+            while self._nsspeech.isSpeaking():
+                time.sleep(0.05)
+
+    def _announce(self, message: str, sound: bool = True, **settings):
         """Send notification to active screen reader with validation"""
         try:
             # Validate settings before proceeding
@@ -140,67 +360,185 @@ class AccessibilityManager:
                 
         except Exception as e:
             self.logger.error(f"Error sending notification: {e}")
+            # The screen reader may have quit, detect again next time
+            self.invalidate_detection_cache()
 
     def _voiceover_notify(self, message: str, sound: bool = True, **settings):
         """Send notification via VoiceOver with enhanced error handling"""
         try:
             if sound:
-                # Map NotifySound types to system sounds
-                sound_mapping = {
-                    NotifySound.MESSAGE: "Morse.aiff",    # Basic notification
-                    NotifySound.MENTION: "Ping.aiff",     # When mentioned
-                    NotifySound.DM: "Purr.aiff",         # Direct messages
-                    NotifySound.URGENT: "Glass.aiff",     # Urgent/important
-                    NotifySound.SUCCESS: "Bottle.aiff",   # Success events
-                    NotifySound.WARNING: "Basso.aiff"     # Warning events
-                }
                 # Get sound type from profile settings
                 sound_type = settings.get('sound_type', NotifySound.MESSAGE)
-                sound_file = sound_mapping.get(sound_type, "Morse.aiff")
-                
-                # Use AppleScript to play sound to avoid audio queue issues
-                sound_script = f'''
-                tell application "System Events"
-                    play sound file "/System/Library/Sounds/{sound_file}"
-                end tell
-                '''
-                subprocess.run(['osascript', '-e', sound_script])
-            
-            # Queue message using current VoiceOver settings
-                apple_script = f'''
-                tell application "System Events"
-                    add "{message}" in queue
-                    say "{message}" without interrupting
-                end tell
-                '''
-            
-            subprocess.run(['osascript', '-e', apple_script])
+                sound_file = _VO_SOUND_FILES.get(sound_type, "Morse.aiff")
+
+                ns_sound = self._load_nssound(sound_file)
+                if ns_sound is not None:
+                    ns_sound.stop()  # Restart if the previous play hasn't finished
+                    ns_sound.play()
+                else:
+                    # Use AppleScript to play sound to avoid audio queue issues
+                    self._run_osascript(
+                        f'tell application "System Events" to play sound file '
+                        f'"/System/Library/Sounds/{sound_file}"'
+                    )
+
+            if self._nsspeech is not None:
+                self._nsspeech.startSpeakingString_(message)
+                return
+
+            # Speak using current VoiceOver settings
+            self._run_osascript(f'say "{_applescript_string(message)}"')
                 
         except Exception as e:
             self.logger.error(f"VoiceOver notification error: {e}")
             
+    def play_system_sound(self, sound_file: str) -> bool:
+        """Play a file from /System/Library/Sounds in-process, returning False without PyObjC"""
+        ns_sound = self._load_nssound(sound_file)
+        if ns_sound is None:
+            return False
+        ns_sound.stop()  # Restart if the previous play hasn't finished
+        ns_sound.play()
+        return True
+
+    def say(self, text: str):
+        """Speak with the system voice after any earlier speech, without a process per call"""
+        if self._nsspeech is not None:
+            while self._nsspeech.isSpeaking():
+                time.sleep(0.05)
+            self._nsspeech.startSpeakingString_(text)
+            return
+        # `say` in the shared osascript session runs after the previous line finishes
+        self._run_osascript(f'say "{_applescript_string(text)}"')
+
+    def voiceover_output(self, text: str):
+        """Have VoiceOver read text, without a new osascript process per call"""
+        self._run_osascript(f'tell application "VoiceOver" to output "{_applescript_string(text)}"')
+
+    def screen_reader_output(self, text: str) -> bool:
+        """Have NVDA or JAWS read text, loading its API on first use; False if neither is running"""
+        if self.screen_reader == ScreenReader.NVDA:
+            if self._nvda is None:
+                self._nvda = self._load_nvda()
+            if self._nvda is not None:
+                self._nvda.speakText(text)
+                return True
+        elif self.screen_reader == ScreenReader.JAWS:
+            if self._jaws is None:
+                self._jaws = self._load_jaws()
+            if self._jaws is not None:
+                self._jaws.SayString(text, False)
+                return True
+        return False
+
+    def speech_dispatcher_say(self, text: str):
+        """Speak through speech-dispatcher after any earlier speech, without a process per call"""
+        if self._spd is not None:
+            try:
+                self._speechd_say(text, 50, 50, 'default')
+                return
+            except Exception as e:
+                self.logger.error(f"speech-dispatcher error: {e}")
+        # Queued `spd-say -w` runs after the previous command finishes
+        self._run_command(['spd-say', '-w', text])
+
+    def _run_osascript(self, line: str):
+        """Run a one-line AppleScript through the shared `osascript -i` process"""
+        with self._osa_lock:
+            try:
+                if self._osa is None or self._osa.poll() is not None:
+                    self._osa = subprocess.Popen(
+                        ['osascript', '-i'],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        bufsize=0
+                    )
+                self._osa.stdin.write(line.encode() + b'\n')
+                self._osa.stdin.flush()
+                return
+            except OSError as e:
+                self.logger.error(f"osascript session error: {e}")
+                self._osa = None
+        self._run_command(['osascript', '-e', line])
+
+    def cleanup(self):
+        """Stop the shared osascript session and speech clients"""
+        if self._spd is not None:
+            try:
+                self._spd.close()
+            except Exception as e:
+                self.logger.error(f"Error closing speech-dispatcher client: {e}")
+            self._spd = None
+        if self._canberra is not None:
+            lib, context = self._canberra
+            lib.ca_context_destroy(context)
+            self._canberra = None
+
+        with self._osa_lock:
+            if self._osa is not None:
+                try:
+                    self._osa.stdin.close()
+                    self._osa.terminate()
+                except Exception as e:
+                    self.logger.error(f"Error stopping osascript: {e}")
+                self._osa = None
+
+    def _load_nssound(self, sound_file: str):
+        """Get a system sound as an NSSound, loading each file only once"""
+        if NSSound is None:
+            return None
+        ns_sound = self._nssounds.get(sound_file)
+        if ns_sound is None:
+            ns_sound = NSSound.alloc().initWithContentsOfFile_byReference_(
+                f"/System/Library/Sounds/{sound_file}", True
+            )
+            if ns_sound is not None:
+                self._nssounds[sound_file] = ns_sound
+        return ns_sound
+
+    def _load_nvda(self):
+        """Import the NVDA controller client"""
+        try:
+            return importlib.import_module('nvda_controller_client').nvdaController
+        except Exception as e:
+            self.logger.error(f"Error loading NVDA controller: {e}")
+            return None
+
+    def _load_jaws(self):
+        """Create the JAWS COM API object"""
+        try:
+            import win32com.client
+            return win32com.client.Dispatch("FreedomSci.JawsApi")
+        except Exception as e:
+            self.logger.error(f"Error loading JAWS API: {e}")
+            return None
+
     def _nvda_notify(self, message: str, sound: bool = True, **settings):
         """Send notification via NVDA with settings"""
         try:
-            import nvda_controller_client as nvda
+            if self._nvda is None:
+                self._nvda = self._load_nvda()
+            nvda = self._nvda
             if sound and settings.get('sound', True):
-                nvda.nvdaController.speakText("notification")
+                nvda.speakText("notification")
             
             # Apply settings if available
             if 'rate' in settings:
-                nvda.nvdaController.setRate(settings['rate'])
+                nvda.setRate(settings['rate'])
             if 'pitch' in settings:
-                nvda.nvdaController.setPitch(settings['pitch'])
+                nvda.setPitch(settings['pitch'])
                 
-            nvda.nvdaController.speakText(message)
+            nvda.speakText(message)
         except Exception as e:
             self.logger.error(f"NVDA notification error: {e}")
 
     def _jaws_notify(self, message: str, sound: bool = True, **settings):
         """Send notification via JAWS with settings"""
         try:
-            import win32com.client
-            jaws = win32com.client.Dispatch("FreedomSci.JawsApi")
+            if self._jaws is None:
+                self._jaws = self._load_jaws()
+            jaws = self._jaws
             
             if sound:
                 sound_type = settings.get('sound', 'MessageBeep')
@@ -216,41 +554,124 @@ class AccessibilityManager:
         except Exception as e:
             self.logger.error(f"JAWS notification error: {e}")
 
+    def _load_canberra(self):
+        """Open libcanberra and create a playback context"""
+        try:
+            import ctypes
+            lib = ctypes.CDLL('libcanberra.so.0')
+            context = ctypes.c_void_p()
+            if lib.ca_context_create(ctypes.byref(context)) != 0:
+                return None
+            return lib, context
+        except (ImportError, OSError) as e:
+            self.logger.debug(f"libcanberra unavailable: {e}")
+            return None
+
+    def _load_speechd(self):
+        """Connect to speech-dispatcher"""
+        try:
+            import speechd
+            return speechd.SSIPClient('easy_slack')
+        except Exception as e:
+            self.logger.debug(f"speech-dispatcher client unavailable: {e}")
+            return None
+
     def _orca_notify(self, message: str, sound: bool = True, **settings):
         """Send notification via Orca with settings"""
         try:
             if sound:
                 sound_file = settings.get('sound', 'message-new-instant')
-                subprocess.run(['paplay', f'/usr/share/sounds/freedesktop/stereo/{sound_file}.oga'])
+                played = False
+                if self._canberra is not None:
+                    lib, context = self._canberra
+                    played = lib.ca_context_play(
+                        context, 0, b"event.id", sound_file.encode(), None
+                    ) == 0
+                if not played:
+                    self._run_command(['paplay', f'/usr/share/sounds/freedesktop/stereo/{sound_file}.oga'])
             
             # Build speech-dispatcher command with settings
             rate = settings.get('rate', 50)
             pitch = settings.get('pitch', 50)
             voice = settings.get('voice', 'default')
+
+            if self._spd is not None:
+                self._speechd_say(message, rate, pitch, voice)
+                return
             
             cmd = [
                 'spd-say',
+                '-w',  # Return only once spoken, so queued speech doesn't overlap
                 '-r', str(rate),
                 '-p', str(pitch),
                 '-t', voice,
                 message
             ]
             
-            subprocess.run(cmd)
+            self._run_command(cmd)
         except Exception as e:
             self.logger.error(f"Orca notification error: {e}")
 
+    def _speechd_say(self, message: str, rate: int, pitch: int, voice: str):
+        """Speak over the persistent speech-dispatcher connection and wait for it to finish"""
+        import speechd
+        self._spd.set_rate(rate)
+        self._spd.set_pitch(pitch)
+        if voice != 'default':
+            self._spd.set_voice(voice)
+
+        done = threading.Event()
+        self._spd.speak(
+            message,
+            callback=lambda callback_type, **kwargs: done.set(),
+            event_types=(speechd.CallbackType.END, speechd.CallbackType.CANCEL)
+        )
+        done.wait(timeout=30)
+
+    def _run_command(self, cmd: List[str]):
+        """Queue a sound/speech command and return immediately"""
+        with self._command_lock:
+            if self._command_thread is None:
+                self._command_thread = threading.Thread(
+                    target=self._command_worker,
+                    daemon=True
+                )
+                self._command_thread.start()
+        self._command_queue.put(cmd)
+
+    def _command_worker(self):
+        """Run queued commands one after another so announcements keep their order"""
+        while True:
+            cmd = self._command_queue.get()
+            try:
+                subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True
+                ).wait()
+            except Exception as e:
+                self.logger.error(f"Error running {cmd[0]}: {e}")
+            finally:
+                self._command_queue.task_done()
+
     def check_voiceover_status(self) -> bool:
         """Check if VoiceOver is running"""
         if self.os_type == "Darwin":
             try:
-                # Use system_profiler to check accessibility
-                result = subprocess.run(
-                    ['defaults', 'read', 'com.apple.universalaccess', 'voiceOverOnOffKey'],
-                    capture_output=True,
-                    text=True
-                )
-                is_running = result.stdout.strip() == '1'
+                if CFPreferencesCopyAppValue is not None:
+                    # Read the preference in-process
+                    value = CFPreferencesCopyAppValue("voiceOverOnOffKey", "com.apple.universalaccess")
+                    is_running = value is not None and int(value) == 1
+                else:
+                    # Use system_profiler to check accessibility
+                    result = subprocess.run(
+                        ['defaults', 'read', 'com.apple.universalaccess', 'voiceOverOnOffKey'],
+                        capture_output=True,
+                        text=True
+                    )
+                    is_running = result.stdout.strip() == '1'
                 
                 if not is_running:
                     print("\nVoiceOver is not running. To hear notifications:")
@@ -1,6 +1,10 @@
 import asyncio
-from typing import Optional, Dict, List, Set
+from typing import Optional, Dict, List, Set, Tuple
 import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from slack_sdk import WebClient
 
@@ -8,18 +12,39 @@ from .models import (
     Message, 
     UserStatus, 
     NotificationPriority, 
+    NotificationRule,
     MessageType,
-    NotifySound
+    NotifySound,
+    format_message_template
 )
 from .rules import RuleEngine, RuleBuilder
 from .sound_management import NotificationManager
 from .status import StatusManager
 from ..utils.websocket import SlackEventHandler
 from ..utils.db import Database
+from ..utils.ratelimit import RateLimiter
+
+_MENTION_RE = re.compile(r'<@([A-Z0-9]+)>')
+
+UNKNOWN_USER = "Unknown User"
+USER_NAME_TTL = 600.0     # Seconds to trust a resolved user name
+UNKNOWN_USER_TTL = 30.0   # Failed lookups are retried sooner
 
 class EasySlack:
     """Main class for accessible Slack interactions"""
-    
+
+    _STATUS_EMOJI: Dict[UserStatus, str] = {
+        UserStatus.ACTIVE: ":green_circle:",
+        UserStatus.FOCUSED: ":headphones:",
+        UserStatus.DND: ":no_entry:",
+        UserStatus.AWAY: ":clock1:"
+    }
+
+    # One WebClient and rate limiter per bot token, shared by every instance in the process
+    _shared_web_clients: Dict[str, WebClient] = {}
+    _shared_rate_limiters: Dict[str, RateLimiter] = {}
+    _shared_lock = threading.Lock()
+
     def __init__(self, config_dir: Optional[Path] = None):
         # Initialize basic components
         self.logger = logging.getLogger("EasySlack")
@@ -28,20 +53,55 @@ class EasySlack:
         
         # Initialize storage and managers
         self.db = Database(self.config_dir / 'workspace.db')
+        self._db_released = False
         self.notify_manager = NotificationManager(self.config_dir)
         self.status_manager = StatusManager()
         self.rule_engine = RuleEngine()  # Initialize without self
+        self.rate_limiter = RateLimiter(capacity=25, rate=1.0)  # Replaced by the token's shared one on login
+        # Notification formatting and playback run here, off the event loop
+        self._notify_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='notify')
         
         # These will be set up during login
         self._web_client: Optional[WebClient] = None
         self._event_handler: Optional[SlackEventHandler] = None
         self._user_id: Optional[str] = None
         self._user_email: Optional[str] = None
+        self._self_mention_token: Optional[str] = None  # "<@UXXXX>", set on login
+        self._user_name_cache: Dict[str, Tuple[float, str]] = {}  # user_id -> (expires_at, name)
+        self._prewarm_task: Optional[asyncio.Task] = None
+        self._inflight_user_lookups: Dict[str, asyncio.Future] = {}  # user_id -> lookup in progress
         
         # Connect status manager
         self.status_manager.add_status_listener(self._handle_status_change)
     
 
+    @classmethod
+    def _shared_web_client(cls, token: str) -> WebClient:
+        """Get the process-wide WebClient for a bot token"""
+        with cls._shared_lock:
+            client = cls._shared_web_clients.get(token)
+            if client is None:
+                client = WebClient(token=token)
+                cls._shared_web_clients[token] = client
+            return client
+
+    @classmethod
+    def _shared_rate_limiter(cls, token: str) -> RateLimiter:
+        """Get the process-wide rate limiter for a bot token, so sessions share Slack's limit"""
+        with cls._shared_lock:
+            limiter = cls._shared_rate_limiters.get(token)
+            if limiter is None:
+                limiter = RateLimiter(capacity=25, rate=1.0)
+                cls._shared_rate_limiters[token] = limiter
+            return limiter
+
+    @classmethod
+    def close_shared(cls):
+        """Drop the shared WebClients and rate limiters, e.g. on shutdown or token change"""
+        with cls._shared_lock:
+            cls._shared_web_clients.clear()
+            cls._shared_rate_limiters.clear()
+
     def get_user_by_email(self, email: str) -> Optional[Dict]:
         """Get user information from Slack API using email"""
         if not self._web_client:
@@ -49,6 +109,7 @@ class EasySlack:
             return None
             
         try:
+            self.rate_limiter.acquire("users.*")
             response = self._web_client.users_lookupByEmail(email=email)
             if response['ok']:
                 return response['user']
@@ -87,20 +148,25 @@ class EasySlack:
                 return False
 
             # Set up clients
-            self._web_client = WebClient(token=tokens['bot_token'])
+            self._web_client = self._shared_web_client(tokens['bot_token'])
+            self.rate_limiter = self._shared_rate_limiter(tokens['bot_token'])
         
             self._event_handler = SlackEventHandler(
                 app_token=tokens['app_token'],
-                bot_token=tokens['bot_token']
+                bot_token=tokens['bot_token'],
+                web_client=self._web_client,
+                user_name_resolver=self._get_user_name
             )
 
-            user_info = self.get_user_by_email(email)
+            # Off the loop: the lookup and any rate-limit wait both block
+            user_info = await asyncio.to_thread(self.get_user_by_email, email)
             if not user_info:
                 self.logger.error(f"Could not find Slack user with email: {email}")
                 return False
 
             self._user_id = user_info['id']
             self._user_email = email
+            self._self_mention_token = f'<@{self._user_id}>'
             
             self.logger.info(f"Logged in as user: {user_info['name']} (ID: {self._user_id})")
 
@@ -110,6 +176,10 @@ class EasySlack:
             self._event_handler.on_message(self._handle_message)
             self._event_handler.on_presence_change(self._handle_presence_change)
             self._event_handler.on_status_change(self._handle_status_change)
+            self._event_handler.on_user_change(self._handle_user_change)
+
+            # Fill the name cache in the background so messages rarely need users.info
+            self._prewarm_task = asyncio.create_task(self._prewarm_user_cache())
 
            
 
@@ -123,6 +193,10 @@ class EasySlack:
         """Start building a notification rule"""
         return RuleBuilder(self.rule_engine).when(trigger)
 
+    def rules_batch(self):
+        """Context manager that registers all rules built inside it in one go"""
+        return self.rule_engine.batch()
+
     async def start(self):
         """Start listening for events"""
         if not self._event_handler:
@@ -144,12 +218,7 @@ class EasySlack:
             
             # Update Slack status
             if self._web_client:
-                status_emoji = {
-                    UserStatus.ACTIVE: ":green_circle:",
-                    UserStatus.FOCUSED: ":headphones:",
-                    UserStatus.DND: ":no_entry:",
-                    UserStatus.AWAY: ":clock1:"
-                }.get(status, ":speech_balloon:")
+                status_emoji = self._STATUS_EMOJI.get(status, ":speech_balloon:")
                 
                 asyncio.create_task(
                     self._event_handler.update_status(
@@ -201,49 +270,66 @@ class EasySlack:
     async def _handle_message(self, event: dict):
         """Handle incoming Slack message"""
         try:
-            # Convert to internal message format
-            message = self._convert_slack_message(event)
+            # Convert to internal message format; an uncached sender name is
+            # only looked up once something is going to show it
+            user_id = event.get('user', '')
+            sender_name = self._cached_user_name(user_id)
+            message = self._convert_slack_message(event, sender_name or '')
             self.logger.info(f"Processing message from: {message.sender_id}")  # Add logging
 
             # Check if message should be buffered
+            if sender_name is None and self.status_manager.buffer.enabled:
+                sender_name = message.sender_name = await self._resolve_user_name(user_id)
             if self.status_manager.should_buffer(message):
                 return
                     
             # Process through rule engine and notify
-            actions = self.rule_engine.process_message(message)
+            rules = self.rule_engine.match_rules(message)
+            if rules and sender_name is None:
+                message.sender_name = await self._resolve_user_name(user_id)
+            actions = self.rule_engine.actions_for(rules, message)
             self.logger.info(f"Rule engine returned actions: {actions}")  # Add logging
             
             # Execute actions
+            loop = asyncio.get_running_loop()
             for action in actions:
                 if action['type'] == 'notify':
-                    self.notify_manager.notify(
-                        message=message,
-                        profile_name=action.get('profile', 'default')
+                    await loop.run_in_executor(
+                        self._notify_pool,
+                        self.notify_manager.notify,
+                        message,
+                        action.get('profile', 'default')
                     )
                         
         except Exception as e:
             self.logger.error(f"Error handling message: {str(e)}")
 
-    def _convert_slack_message(self, event: dict) -> Message:
+    def _convert_slack_message(self, event: dict, sender_name: Optional[str] = None) -> Message:
         """Convert Slack event to internal message format"""
+        text = event.get('text', '')
+        user_id = event.get('user', '')
+        thread_ts = event.get('thread_ts')
+        # Plain channel chatter has no "<@", so both mention scans can be skipped
+        has_mentions = '<@' in text
+
         msg_type = MessageType.CHANNEL
         if event.get('channel_type') == 'im':
             msg_type = MessageType.DIRECT
-        elif event.get('thread_ts'):
+        elif thread_ts:
             msg_type = MessageType.THREAD
-        elif f'<@{self._user_id}>' in event.get('text', ''):
+        elif has_mentions and self._self_mention_token and self._self_mention_token in text:
             msg_type = MessageType.MENTION
 
         return Message(
             id=event.get('client_msg_id', ''),
-            content=event.get('text', ''),
-            sender_id=event.get('user', ''),
-            sender_name=self._get_user_name(event.get('user', '')),
+            content=text,
+            sender_id=user_id,
+            sender_name=sender_name if sender_name is not None else self._get_user_name(user_id),
             channel_id=event.get('channel', ''),
-            thread_id=event.get('thread_ts'),
+            thread_id=thread_ts,
             timestamp=float(event.get('ts', 0)),
             message_type=msg_type,
-            mentions=self._extract_mentions(event.get('text', ''))
+            mentions=self._extract_mentions(text) if has_mentions else []
         )
 
     async def _execute_action(self, action: Dict, message: Message):
@@ -259,12 +345,7 @@ class EasySlack:
                 )
             elif action_type == 'speak':
                 print("speak the message = "+str(message.content))
-                msg_text = params.get('message', '').format(
-                    sender=message.sender_name,
-                    content=message.content,
-                    channel=message.channel_id or 'DM',
-                    time=message.formatted_time
-                )
+                msg_text = format_message_template(params.get('message', ''), message)
                 self.notify_manager.notify(
                     message,
                     'default',
@@ -302,39 +383,160 @@ class EasySlack:
             elif presence == 'active':
                 self.set_status(UserStatus.ACTIVE)
 
+    async def _resolve_user_name(self, user_id: str) -> str:
+        """Get user name without blocking the loop, sharing one lookup per user"""
+        name = self._cached_user_name(user_id)
+        if name is not None:
+            return name
+
+        future = self._inflight_user_lookups.get(user_id)
+        if future is not None:
+            # Shielded so a cancelled waiter doesn't cancel the shared lookup
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_user_lookups[user_id] = future
+        try:
+            name = await asyncio.to_thread(self._get_user_name, user_id)
+        except Exception as e:
+            self.logger.error(f"Error resolving user name: {e}")
+            name = UNKNOWN_USER
+        finally:
+            del self._inflight_user_lookups[user_id]
+            # Waiters always get a name, even if this coroutine was cancelled
+            if not future.done():
+                future.set_result(name if name is not None else UNKNOWN_USER)
+        return name
+
+    def _cached_user_name(self, user_id: str) -> Optional[str]:
+        """Get user name if it needs no lookup, else None"""
+        if not user_id or not self._web_client:  # Check for web_client
+            return UNKNOWN_USER
+
+        cached = self._user_name_cache.get(user_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
     def _get_user_name(self, user_id: str) -> str:
-        """Get user name from Slack API"""
+        """Get user name, from cache when fresh or else the Slack API"""
+        name = self._cached_user_name(user_id)
+        if name is not None:
+            return name
+
+        # Known users resolve locally before spending a users.info call
+        user = self.db.get_user_by_slack_id(user_id)
+        if user:
+            self._user_name_cache[user_id] = (time.monotonic() + USER_NAME_TTL, user['name'])
+            return user['name']
+
+        name = UNKNOWN_USER
         try:
-            if not user_id or not self._web_client:  # Check for web_client
-                return "Unknown User"
+            self.rate_limiter.acquire("users.*")
             response = self._web_client.users_info(user=user_id)  # Use _web_client
             if response['ok']:
-                user = response['user']
-                # Try real name first, then display name, then username
-                return (user.get('real_name') or 
-                    user.get('profile', {}).get('display_name') or 
-                    user.get('name') or 
-                    "Unknown User")
+                name = self._display_name(response['user'])
+                self._remember_user(response['user'], name)
         except Exception as e:
             self.logger.error(f"Error getting user name: {e}")
-        return "Unknown User"
+
+        ttl = UNKNOWN_USER_TTL if name == UNKNOWN_USER else USER_NAME_TTL
+        self._user_name_cache[user_id] = (time.monotonic() + ttl, name)
+        return name
+
+    def _remember_user(self, user: Dict, name: str):
+        """Store a looked-up user so later lookups stay local"""
+        email = user.get('profile', {}).get('email')
+        if not email:
+            return
+        try:
+            self.db.remember_slack_user(name, email, user['id'])
+        except Exception as e:
+            self.logger.error(f"Error saving user {user['id']}: {e}")
+
+    async def _prewarm_user_cache(self):
+        """Load every workspace member's name into the cache via users.list"""
+        cursor = None
+        count = 0
+        try:
+            while True:
+                response = await asyncio.to_thread(self._users_list_page, cursor)
+                if not response['ok']:
+                    break
+
+                expires_at = time.monotonic() + USER_NAME_TTL
+                for user in response['members']:
+                    self._user_name_cache[user['id']] = (expires_at, self._display_name(user))
+                count += len(response['members'])
+
+                cursor = response.get('response_metadata', {}).get('next_cursor')
+                if not cursor:
+                    break
+            self.logger.info(f"Cached names for {count} users")
+        except Exception as e:
+            self.logger.error(f"Error prewarming user cache: {e}")
+
+    def _users_list_page(self, cursor: Optional[str]):
+        """Fetch one users.list page, waiting on the rate limiter in the calling thread"""
+        self.rate_limiter.acquire("users.list")
+        return self._web_client.users_list(limit=1000, cursor=cursor)
+
+    @staticmethod
+    def _display_name(user: Dict) -> str:
+        """Pick the best name from a Slack user object"""
+        # Try real name first, then display name, then username
+        return (user.get('real_name') or 
+            user.get('profile', {}).get('display_name') or 
+            user.get('name') or 
+            UNKNOWN_USER)
+
+    async def _handle_user_change(self, event: dict):
+        """Drop the cached name of a user whose profile changed"""
+        user = event.get('user')
+        user_id = user.get('id') if isinstance(user, dict) else user
+        if user_id:
+            self._user_name_cache.pop(user_id, None)
+        if isinstance(user, dict) and user_id:
+            # Keep the stored name in step, or the local lookup would serve the old one
+            self._remember_user(user, self._display_name(user))
 
     def _extract_mentions(self, text: str) -> List[str]:
         """Extract user mentions from message text"""
-        import re
-        return re.findall(r'<@([A-Z0-9]+)>', text)
+        return _MENTION_RE.findall(text)
 
     def _load_rules(self):
         """Load saved rules from database"""
         try:
-            rules = self.db.get_rules()
-            for rule in rules:
-                self.rule_engine.add_rule(rule)
+            # One add_rules call builds the engine's sender/channel/keyword indexes once
+            self.rule_engine.add_rules([
+                NotificationRule(
+                    id=row['id'],
+                    name=row['name'],
+                    conditions=row['conditions'],
+                    actions=row['actions'],
+                    priority=NotificationPriority.from_value(row['priority'].lower()),
+                    enabled=row['enabled']
+                )
+                for row in self.db.get_rules(only_enabled=True)
+            ])
         except Exception as e:
             self.logger.error(f"Error loading rules: {str(e)}")
 
     async def stop(self):
         """Stop listening for events"""
+        if self._prewarm_task is not None:
+            # Stop paging users.list, which draws on the token's shared bucket
+            self._prewarm_task.cancel()
+            try:
+                await self._prewarm_task
+            except asyncio.CancelledError:
+                pass
+            self._prewarm_task = None
         if self._event_handler:
             await self._event_handler.stop()
             self.logger.info("Stopped EasySlack")
+        self._notify_pool.shutdown(wait=False)
+        if not self._db_released:
+            # Database is shared per path; close() only drops this session's reference
+            self._db_released = True
+            self.db.close()
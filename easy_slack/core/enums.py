@@ -1,19 +1,20 @@
 from enum import Enum
+from functools import lru_cache
 
-class ScreenReader(Enum):
+class ScreenReader(str, Enum):
     VOICEOVER = "voiceover"
     NVDA = "nvda"
     JAWS = "jaws"
     ORCA = "orca"
     NONE = "none"
 
-class MessageType(Enum):
+class MessageType(str, Enum):
     DIRECT = "direct"
     CHANNEL = "channel"
     THREAD = "thread"
     MENTION = "mention"
 
-class UserStatus(Enum):
+class UserStatus(str, Enum):
     ACTIVE = "active"
     FOCUSED = "focused"
     DND = "do_not_disturb"
@@ -37,11 +38,41 @@ class NotificationPriority(Enum):
             return self == NotificationPriority.CRITICAL
         return False
 
-class NotifySound(Enum):
+    @property
+    def rank(self) -> int:
+        """Numeric urgency, LOW lowest"""
+        return _PRIORITY_RANK[self]
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def from_value(cls, value: str) -> 'NotificationPriority':
+        """Look up a member by value, memoized"""
+        try:
+            return cls._value2member_map_[value]
+        except KeyError:
+            return cls(value)  # Raises the usual ValueError
+
+_PRIORITY_RANK = {
+    NotificationPriority.LOW: 1,
+    NotificationPriority.MEDIUM: 2,
+    NotificationPriority.HIGH: 3,
+    NotificationPriority.CRITICAL: 4
+}
+
+class NotifySound(str, Enum):
     """Notify-py default sounds"""
     MESSAGE = "base"      # Regular message
     MENTION = "ping"      # User mention
     DM = "hello"         # Direct message
     URGENT = "error"     # Urgent/important
     SUCCESS = "success"  # Success events
-    WARNING = "warning"  # Warning events
\ No newline at end of file
+    WARNING = "warning"  # Warning events
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def from_value(cls, value: str) -> 'NotifySound':
+        """Look up a member by value, memoized"""
+        try:
+            return cls._value2member_map_[value]
+        except KeyError:
+            return cls(value)  # Raises the usual ValueError
@@ -1,6 +1,12 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Any, Optional, Tuple
+from collections import Counter
+from typing import Dict, List, Set, FrozenSet, Any, Mapping, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+from string import Formatter
+import re
+import sys
+from types import MappingProxyType
 from .enums import (
     MessageType, 
     UserStatus, 
@@ -9,7 +15,100 @@ from .enums import (
     ScreenReader
 )
 
-@dataclass
+TemplateParts = List[Tuple[str, Optional[str]]]
+
+# Per-message and per-rule types drop their __dict__ where dataclasses allow it (3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Read-only defaults, inner mappings included; each profile gets its own dict copies
+_DEFAULT_SR_SETTINGS = MappingProxyType({
+    'voiceover': MappingProxyType({
+        'voice': 'Alex',
+        'rate': 250,
+        'pitch': 50,
+        'sound': 'Glass'
+    }),
+    'nvda': MappingProxyType({
+        'voice': 'Microsoft David',
+        'rate': 50,
+        'pitch': 50,
+        'sound': True
+    }),
+    'jaws': MappingProxyType({
+        'voice': 'Microsoft David',
+        'rate': 50,
+        'pitch': 50,
+        'sound': 'MessageBeep'
+    }),
+    'orca': MappingProxyType({
+        'voice': 'default',
+        'rate': 50,
+        'pitch': 50,
+        'sound': 'message-new-instant'
+    })
+})
+
+# Every screen reader needs the same settings
+_REQUIRED_SR_KEYS = frozenset({'voice', 'rate', 'pitch', 'sound'})
+
+def compile_template(template: str) -> Optional[TemplateParts]:
+    """Split a format template into (literal, field) pairs, or None if it needs str.format"""
+    parts = []
+    try:
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            if field_name is not None and (format_spec or conversion or not field_name.isidentifier()):
+                return None
+            parts.append((literal, field_name))
+    except ValueError:
+        # Malformed, e.g. a stray brace; str.format raises the error when it is rendered
+        return None
+    return parts
+
+def render_template(template: str, parts: Optional[TemplateParts], context: Mapping[str, Any]) -> str:
+    """Fill a template from its compiled parts, falling back to str.format"""
+    if parts is None:
+        return template.format_map(context)
+    if len(parts) == 1 and parts[0][1] is None:
+        return parts[0][0]  # No fields, e.g. a fixed title
+    return ''.join(
+        literal if field_name is None else literal + str(context[field_name])
+        for literal, field_name in parts
+    )
+
+class MessageContext:
+    """Template fields read straight off a message, so no dict is built per notification"""
+    __slots__ = ('_message',)
+
+    def __init__(self, message: 'Message'):
+        self._message = message
+
+    def __getitem__(self, key: str) -> Any:
+        message = self._message
+        if key == 'sender':
+            return message.sender_name
+        elif key == 'content':
+            return message.content
+        elif key == 'channel':
+            return message.channel_id or 'DM'
+        elif key == 'time':
+            return message.formatted_time  # Cached on the message
+        raise KeyError(key)
+
+def format_message_template(template: str, message: 'Message') -> str:
+    """Fill {sender}/{content}/{channel}/{time} in a template from a message"""
+    if '{' not in template:
+        return template
+    return template.format_map(MessageContext(message))
+
+@lru_cache(maxsize=256)
+def compile_content_pattern(pattern: str) -> re.Pattern:
+    """Compile a content condition once, case-insensitively"""
+    return re.compile(pattern, re.IGNORECASE)
+
+# Cheap equality checks run before the content regex
+_CONDITION_COST = {'sender': 0, 'channel': 1, 'message_type': 2, 'content': 3}
+
+@dataclass(**_SLOTS)
 class Message:
     id: str
     content: str
@@ -21,10 +120,13 @@ class Message:
     message_type: MessageType
     mentions: List[str] = field(default_factory=list)
     metadata: Dict = field(default_factory=dict)
+    _formatted_time: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def formatted_time(self) -> str:
-        return datetime.fromtimestamp(self.timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        if self._formatted_time is None:
+            self._formatted_time = datetime.fromtimestamp(self.timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        return self._formatted_time
 
     def format_content(self, max_length: int = 100) -> str:
         content = self.content
@@ -32,7 +134,7 @@ class Message:
             content = content[:max_length-3] + "..."
         return content
 
-@dataclass
+@dataclass(**_SLOTS)
 class NotificationRule:
     id: str
     name: str
@@ -40,17 +142,29 @@ class NotificationRule:
     actions: List[Dict]
     priority: NotificationPriority
     enabled: bool = True
-    exceptions: Set[str] = field(default_factory=set)
+    exceptions: FrozenSet[str] = field(default_factory=frozenset)
+
+    # Conditions ordered cheapest first
+    _ordered_conditions: List[Tuple[str, str]] = field(default_factory=list, init=False, repr=False, compare=False)
+    _has_exceptions: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.exceptions = frozenset(self.exceptions)
+        self._has_exceptions = bool(self.exceptions)
+        self._ordered_conditions = sorted(
+            self.conditions.items(),
+            key=lambda item: _CONDITION_COST.get(item[0], len(_CONDITION_COST))
+        )
 
     def matches(self, message: Message) -> bool:
         """Check if message matches rule conditions"""
         if not self.enabled:
             return False
             
-        if message.sender_id in self.exceptions:
+        if self._has_exceptions and message.sender_id in self.exceptions:
             return False
             
-        for condition_type, value in self.conditions.items():
+        for condition_type, value in self._ordered_conditions:
             if not self._check_condition(condition_type, value, message):
                 return False
         return True
@@ -58,20 +172,16 @@ class NotificationRule:
     def _check_condition(self, condition_type: str, value: str, message: Message) -> bool:
         """Check individual condition"""
         if condition_type == "sender":
-            if value == "self":
-                return (message.message_type == MessageType.DIRECT and 
-                        message.sender_id == message.channel_id)
             return message.sender_id == value
         elif condition_type == "channel":
             return message.channel_id == value
         elif condition_type == "content":
-            import re
-            return bool(re.search(value, message.content, re.IGNORECASE))
+            return compile_content_pattern(value).search(message.content) is not None
         elif condition_type == "message_type":
             return message.message_type.value == value
         return False
 
-@dataclass
+@dataclass(**_SLOTS)
 class UserPreferences:
     user_id: str
     notification_sound: bool = True
@@ -82,13 +192,16 @@ class UserPreferences:
     buffer_exceptions: Set[str] = field(default_factory=set)
     status: UserStatus = UserStatus.ACTIVE
 
-@dataclass
+@dataclass(**_SLOTS)
 class NotificationBuffer:
     enabled: bool = False
     messages: List[Message] = field(default_factory=list)
     start_time: Optional[float] = None
     exceptions: Set[str] = field(default_factory=set)
 
+    # Buffered message count per sender, kept in step with messages
+    _counts: Counter = field(default_factory=Counter, init=False, repr=False, compare=False)
+
     def add_message(self, message: Message) -> bool:
         """Add message to buffer if appropriate"""
         if not self.enabled:
@@ -97,6 +210,7 @@ class NotificationBuffer:
             return False
         
         self.messages.append(message)
+        self._counts[message.sender_name] += 1
         return True
 
     def get_summary(self) -> str:
@@ -104,25 +218,22 @@ class NotificationBuffer:
         if not self.messages:
             return "No buffered messages"
 
-        counts: Dict[str, int] = {}
-        for msg in self.messages:
-            counts[msg.sender_name] = counts.get(msg.sender_name, 0) + 1
-
-        summary = []
-        for sender, count in counts.items():
-            summary.append(f"{count} message{'s' if count > 1 else ''} from {sender}")
-
-        return ", ".join(summary)
+        return ", ".join(
+            f"{count} message{'s' if count > 1 else ''} from {sender}"
+            for sender, count in self._counts.items()
+        )
 
     def clear(self) -> List[Message]:
         """Clear buffer and return messages"""
-        messages = self.messages.copy()
-        self.messages.clear()
+        # Hand the list over rather than copying it
+        messages = self.messages
+        self.messages = []
+        self._counts = Counter()
         self.start_time = None
         self.enabled = False
         return messages
 
-@dataclass
+@dataclass(**_SLOTS)
 class NotificationProfile:
     name: str
     sound_type: NotifySound
@@ -132,55 +243,27 @@ class NotificationProfile:
     enabled: bool = True
     priority: NotificationPriority = NotificationPriority.MEDIUM
     screen_reader_settings: Dict[str, Any] = field(default_factory=lambda: {
-        'voiceover': {
-            'voice': 'Alex',
-            'rate': 250,
-            'pitch': 50,
-            'sound': 'Glass'
-        },
-        'nvda': {
-            'voice': 'Microsoft David',
-            'rate': 50,
-            'pitch': 50,
-            'sound': True
-        },
-        'jaws': {
-            'voice': 'Microsoft David',
-            'rate': 50,
-            'pitch': 50,
-            'sound': 'MessageBeep'
-        },
-        'orca': {
-            'voice': 'default',
-            'rate': 50,
-            'pitch': 50,
-            'sound': 'message-new-instant'
-        }
+        reader: dict(settings) for reader, settings in _DEFAULT_SR_SETTINGS.items()
     })
 
+    # Templates parsed once at creation
+    _title_parts: Optional[TemplateParts] = field(default=None, init=False, repr=False, compare=False)
+    _message_parts: Optional[TemplateParts] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._title_parts = compile_template(self.title_template)
+        self._message_parts = compile_template(self.message_template)
+
     def format_message(self, message: Message) -> tuple[str, str]:
         """Format title and message using templates"""
-        context = {
-            'sender': message.sender_name,
-            'content': message.content,
-            'channel': message.channel_id or 'DM',
-            'time': message.formatted_time
-        }
+        context = MessageContext(message)
         
-        title = self.title_template.format(**context)
-        msg = self.message_template.format(**context)
+        title = render_template(self.title_template, self._title_parts, context)
+        msg = render_template(self.message_template, self._message_parts, context)
         return title, msg
 
     def validate_settings(self, screen_reader: ScreenReader) -> bool:
         """Validate settings for given screen reader"""
-        sr_type = screen_reader.value
-        if sr_type not in self.screen_reader_settings:
-            return False
-            
-        settings = self.screen_reader_settings[sr_type]
-        # Basic validation rules per screen reader
-        if sr_type == 'voiceover':
-            return all(key in settings for key in ['voice', 'rate', 'pitch', 'sound'])
-        elif sr_type in ['nvda', 'jaws', 'orca']:
-            return all(key in settings for key in ['voice', 'rate', 'pitch', 'sound'])
-        return False
\ No newline at end of file
+        # str-valued enum, usable as a key directly
+        settings = self.screen_reader_settings.get(screen_reader)
+        return settings is not None and _REQUIRED_SR_KEYS.issubset(settings)
@@ -1,14 +1,37 @@
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Set, FrozenSet
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import replace
 import re
 import logging
 from .models import (
     Message, 
     NotificationPriority, 
     NotificationRule,
-    UserStatus
+    UserStatus,
+    MessageContext,
+    TemplateParts,
+    compile_template,
+    render_template
 )
 import time
 
+# pyahocorasick finds every keyword in one pass; without it a combined regex
+# can only tell whether any keyword matched
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+_MAX_PROCESSED = 1024  # Message ids remembered for de-duplication
+
+# Characters that make a content condition a real regex rather than a keyword
+_REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
+def _is_literal(pattern: str) -> bool:
+    """Check if a content pattern is a plain keyword"""
+    return not _REGEX_METACHARACTERS.intersection(pattern)
+
 class RuleEngine:
     """Handles notification rules and message processing"""
     
@@ -16,24 +39,202 @@ class RuleEngine:
         self.logger = logging.getLogger("RuleEngine")
         self.rules: Dict[str, NotificationRule] = {}
         self.current_status = UserStatus.ACTIVE
+        self._allowed_priorities: FrozenSet[NotificationPriority] = self._priorities_allowed(self.current_status)
         self.slack = None  # Will be set later
-        self._processed_messages = set()  # Cache for processed message IDs
+        self._processed_messages: "OrderedDict[str, None]" = OrderedDict()  # Recently processed message IDs, oldest first
         self._start_time = time.time()    # Store engine start tim
+        self._pending_rules: Optional[List[NotificationRule]] = None  # Set while batching
+        self._awaiting_user_id: List[NotificationRule] = []  # "self" rules built before login
+        # One alternation over every keyword rule, so a message matching none
+        # of them is rejected with a single search
+        self._keyword_rule_ids: Set[str] = set()
+        self._keyword_automaton: Optional[re.Pattern] = None
+        self._keyword_ac = None  # ahocorasick.Automaton: keyword -> rule ids
+        # Rules bucketed by one equality condition, so a message only checks
+        # rules that could match it; everything else is unindexed
+        self._by_sender: Dict[str, List[NotificationRule]] = {}
+        self._by_channel: Dict[str, List[NotificationRule]] = {}
+        self._by_type: Dict[str, List[NotificationRule]] = {}
+        self._unindexed: List[NotificationRule] = []
+        self._rule_order: Dict[str, int] = {}
+        # Action message templates parsed when their rule is added
+        self._action_templates: Dict[str, Optional[TemplateParts]] = {}
         
     def set_slack_client(self, slack_instance):
         """Set the Slack client after initialization"""
         self.slack = slack_instance
+        user_id = getattr(slack_instance, '_user_id', None)
+        if user_id and self._awaiting_user_id:
+            waiting, self._awaiting_user_id = self._awaiting_user_id, []
+            self.add_rules([
+                replace(rule, conditions={**rule.conditions, 'sender': user_id})
+                for rule in waiting
+            ])
+
+    def add_rule_awaiting_user_id(self, rule: NotificationRule):
+        """Hold a rule on the user's own messages until login supplies the user ID"""
+        self._awaiting_user_id.append(rule)
+        self.logger.info(f"Rule {rule.name} will be added once the user ID is known")
+        
+    def _resolve_self_sender(self, rules: List[NotificationRule]) -> List[NotificationRule]:
+        """Swap a stored "self" sender for the user ID, holding rules back until it is known"""
+        user_id = getattr(self.slack, '_user_id', None)
+        resolved = []
+        for rule in rules:
+            sender = rule.conditions.get('sender')
+            if not (isinstance(sender, str) and sender.lower() == "self"):
+                resolved.append(rule)
+            elif user_id:
+                resolved.append(replace(rule, conditions={**rule.conditions, 'sender': user_id}))
+            else:
+                # set_slack_client overwrites the sender once login supplies it
+                self.add_rule_awaiting_user_id(rule)
+        return resolved
         
     def add_rule(self, rule: NotificationRule):
         """Add or update a notification rule"""
+        if self._pending_rules is not None:
+            self._pending_rules.append(rule)
+            return
+        resolved = self._resolve_self_sender([rule])
+        if not resolved:
+            return
+        rule = resolved[0]
+        self._compile_rule_templates([rule])
         self.rules[rule.id] = rule
+        self._rebuild_indexes()
         self.logger.info(f"Added rule: {rule.name}")
+
+    def add_rules(self, rules: List[NotificationRule]):
+        """Add or update several notification rules at once"""
+        rules = self._resolve_self_sender(rules)
+        self._compile_rule_templates(rules)
+        for rule in rules:
+            self.rules[rule.id] = rule
+        self._rebuild_indexes()
+        if rules:
+            self.logger.info(f"Added {len(rules)} rules: {', '.join(r.name for r in rules)}")
+
+    @contextmanager
+    def batch(self):
+        """Collect rules added inside the block and register them together on exit"""
+        if self._pending_rules is not None:
+            # Already batching, let the outer block register
+            yield
+            return
+        self._pending_rules = []
+        try:
+            yield
+            pending = self._pending_rules
+        finally:
+            self._pending_rules = None
+        self.add_rules(pending)
         
     def remove_rule(self, rule_id: str):
         """Remove a rule"""
         if rule_id in self.rules:
             del self.rules[rule_id]
+            self._rebuild_indexes()
             self.logger.info(f"Removed rule: {rule_id}")
+
+    def _rebuild_indexes(self):
+        """Rebuild every lookup structure derived from the rule set"""
+        self._rebuild_condition_index()
+        self._rebuild_keyword_automaton()
+        self._compile_action_templates()
+
+    def _compile_rule_templates(self, rules: List[NotificationRule]):
+        """Parse the message templates of rules about to be added"""
+        for rule in rules:
+            for action in rule.actions:
+                template = action.get('params', {}).get('message')
+                if template is not None and template not in self._action_templates:
+                    self._action_templates[template] = compile_template(template)
+
+    def _compile_action_templates(self):
+        """Keep the parsed templates of current rules, dropping the rest"""
+        compiled = self._action_templates
+        templates = {}
+        for rule in self.rules.values():
+            for action in rule.actions:
+                template = action.get('params', {}).get('message')
+                if template is not None and template not in templates:
+                    parts = compiled[template] if template in compiled else compile_template(template)
+                    templates[template] = parts
+        self._action_templates = templates
+
+    def _render_action_message(self, template: str, message: Message) -> str:
+        """Fill an action template from its precompiled parts"""
+        if template not in self._action_templates:
+            self._action_templates[template] = compile_template(template)
+        return render_template(template, self._action_templates[template], MessageContext(message))
+
+    def _rebuild_condition_index(self):
+        """Bucket each rule under its most selective equality condition"""
+        self._by_sender = {}
+        self._by_channel = {}
+        self._by_type = {}
+        self._unindexed = []
+        self._rule_order = {}
+
+        for order, rule in enumerate(self.rules.values()):
+            self._rule_order[rule.id] = order
+            conditions = rule.conditions
+            sender = conditions.get('sender')
+            if sender is not None:
+                self._by_sender.setdefault(sender, []).append(rule)
+            elif 'channel' in conditions:
+                self._by_channel.setdefault(conditions['channel'], []).append(rule)
+            elif 'message_type' in conditions:
+                self._by_type.setdefault(conditions['message_type'], []).append(rule)
+            else:
+                self._unindexed.append(rule)
+
+    def _candidate_rules(self, message: Message) -> List[NotificationRule]:
+        """Rules that could match the message, in the order they were added"""
+        candidates = [
+            *self._by_sender.get(message.sender_id, ()),
+            *self._by_channel.get(message.channel_id, ()),
+            *self._by_type.get(message.message_type.value, ()),
+            *self._unindexed
+        ]
+        candidates.sort(key=lambda rule: self._rule_order[rule.id])
+        return candidates
+
+    def _rebuild_keyword_automaton(self):
+        """Rebuild the keyword matcher for literal content rules"""
+        keywords: Dict[str, Set[str]] = {}  # lowercased keyword -> rule ids
+        for rule in self.rules.values():
+            pattern = rule.conditions.get('content')
+            if pattern and _is_literal(pattern):
+                keywords.setdefault(pattern.lower(), set()).add(rule.id)
+
+        self._keyword_rule_ids = set().union(*keywords.values())
+        self._keyword_automaton = None
+        self._keyword_ac = None
+        if not keywords:
+            return
+
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword, rule_ids in keywords.items():
+                automaton.add_word(keyword, frozenset(rule_ids))
+            automaton.make_automaton()
+            self._keyword_ac = automaton
+        else:
+            # Keywords are lowercased, and so is the content searched
+            self._keyword_automaton = re.compile('|'.join(re.escape(k) for k in keywords))
+
+    def _matched_keyword_rules(self, content_lower: str) -> Set[str]:
+        """Ids of keyword rules whose keyword may occur in the lowercased content"""
+        if self._keyword_ac is not None:
+            matched: Set[str] = set()
+            for _, rule_ids in self._keyword_ac.iter(content_lower):
+                matched |= rule_ids
+            return matched
+        if self._keyword_automaton is not None and self._keyword_automaton.search(content_lower):
+            return self._keyword_rule_ids
+        return set()
             
     def get_rule(self, rule_id: str) -> Optional[NotificationRule]:
         """Get rule by ID"""
@@ -41,47 +242,73 @@ class RuleEngine:
             
     def process_message(self, message: Message) -> List[Dict]:
         """Process message and return prioritized actions"""
-        actions = []
+        if not self._accept(message):
+            return []
+        return self._match_actions(message)
 
-        if message.timestamp < self._start_time:
+    def match_rules(self, message: Message) -> List[NotificationRule]:
+        """Accept a message and return the rules it triggers, without rendering their actions"""
+        if not self._accept(message):
             return []
+        return self._matching_rules(message)
+
+    def actions_for(self, rules: List[NotificationRule], message: Message) -> List[Dict]:
+        """Render the prioritized actions of rules returned by match_rules"""
+        # Actions grouped by rule priority rank, emitted most urgent first
+        buckets: Dict[int, List[Dict]] = {}
+        for rule in rules:
+            processed_actions = self._process_actions(rule.actions, message)
+            if processed_actions:
+                buckets.setdefault(rule.priority.rank, []).extend(processed_actions)
+
+        return [action for rank in sorted(buckets, reverse=True)
+                for action in buckets[rank]]
+
+    def process_messages(self, messages: List[Message]) -> List[List[Dict]]:
+        """Process a batch of messages, returning each one's prioritized actions in order"""
+        accepted = [self._accept(message) for message in messages]
+        return [
+            self._match_actions(message) if ok else []
+            for message, ok in zip(messages, accepted)
+        ]
+
+    def _accept(self, message: Message) -> bool:
+        """Check a message is new and unseen, remembering its ID"""
+        if message.timestamp < self._start_time:
+            return False
         
         if message.id in self._processed_messages:
-            return []
+            self._processed_messages.move_to_end(message.id)
+            return False
             
-        # Add to processed cache
-        self._processed_messages.add(message.id)
-        
-        # Trim cache if it gets too large
-        if len(self._processed_messages) > 1000:
-            self._processed_messages.clear()
-        
+        # Add to processed cache, forgetting the oldest id once full
+        self._processed_messages[message.id] = None
+        if len(self._processed_messages) > _MAX_PROCESSED:
+            self._processed_messages.popitem(last=False)
+        return True
+
+    def _match_actions(self, message: Message) -> List[Dict]:
+        """Run the rules against an accepted message"""
+        return self.actions_for(self._matching_rules(message), message)
+
+    def _matching_rules(self, message: Message) -> List[NotificationRule]:
+        """Find the rules an accepted message triggers at the current status"""
+        matched = []
         try:
-            # Process each rule
-            for rule in self.rules.values():
+            # Lowercase once for every keyword rule rather than case-folding per pattern
+            keyword_hits = (self._matched_keyword_rules(message.content.lower())
+                            if self._keyword_rule_ids else set())
+
+            # Check each rule that could apply
+            for rule in self._candidate_rules(message):
+                if rule.id in self._keyword_rule_ids and rule.id not in keyword_hits:
+                    continue
                 if rule.matches(message):
                     # Check if rule priority can break through current status
-                    if rule.priority.can_break_through(self.current_status):
-                        processed_actions = self._process_actions(rule.actions, message)
-                        actions.extend(processed_actions)
-            
-            # Sort by priority - handle both string and enum priorities
-            def get_priority_value(action):
-                priority = action.get('priority', 'MEDIUM')
-                if isinstance(priority, str):
-                    # Convert string priority to enum
-                    return NotificationPriority[priority.upper()].value
-                return priority.value
-            
-            # Sort actions
-            sorted_actions = sorted(
-                actions,
-                key=get_priority_value,
-                reverse=True
-            )
-            
-            return sorted_actions
-            
+                    if rule.priority in self._allowed_priorities:
+                        matched.append(rule)
+            return matched
+
         except Exception as e:
             self.logger.error(f"Error processing message: {str(e)}")
             return []
@@ -92,29 +319,24 @@ class RuleEngine:
         
         for action in actions:
             try:
-                # Deep copy action to avoid modifying original
-                processed_action = action.copy()
                 self.logger.debug(f"Processing action for message: {message.content}")
-                
-                # Process message templates in action parameters
-                params = processed_action.get('params', {})
-                if params and 'message' in params:
-                    template = params['message']
-                    if template is not None:  # Check if template exists
-                        params['message'] = template.format(
-                            sender=message.sender_name,
-                            content=message.content,
-                            channel=message.channel_id or 'DM',
-                            time=message.formatted_time
-                        )
-                    else:
-                        # If no template, use content directly
-                        params['message'] = message.content
+
+                # Build the payload fresh; the rule's own action and params are never modified
+                params = action.get('params') or {}
+                template = params.get('message')
+                if template is not None:
+                    text = self._render_action_message(template, message)
                 else:
-                    # If no message parameter exists, add one with content
-                    processed_action['params'] = params
-                    processed_action['params']['message'] = message.content
-                    
+                    # If no template, use content directly
+                    text = message.content
+
+                processed_action = {
+                    'type': action['type'],
+                    'priority': action.get('priority', NotificationPriority.MEDIUM.name),
+                    'params': {'title': params.get('title'), 'message': text}
+                }
+                if 'profile' in action:
+                    processed_action['profile'] = action['profile']
                 processed.append(processed_action)
                 
             except Exception as e:
@@ -124,8 +346,14 @@ class RuleEngine:
     def set_status(self, status: UserStatus):
         """Update current status"""
         self.current_status = status
+        self._allowed_priorities = self._priorities_allowed(status)
         self.logger.info(f"Rule engine status set to: {status.name}")
 
+    @staticmethod
+    def _priorities_allowed(status: UserStatus) -> FrozenSet[NotificationPriority]:
+        """Priorities that can break through the given status"""
+        return frozenset(p for p in NotificationPriority if p.can_break_through(status))
+
 class RuleBuilder:
     """Fluent interface for building notification rules"""
     
@@ -136,6 +364,7 @@ class RuleBuilder:
         self._name = None
         self._priority = NotificationPriority.MEDIUM
         self._exceptions = set()
+        self._awaits_user_id = False  # from_person("self") before login
         
     def from_person(self, identifier: str) -> 'RuleBuilder':
             """Add sender condition"""
@@ -143,8 +372,11 @@ class RuleBuilder:
                 # Get the user ID from EasySlack instance
                 if self.engine.slack and self.engine.slack._user_id:
                     self._conditions['sender'] = self.engine.slack._user_id
+                    self._awaits_user_id = False
                 else:
-                    raise ValueError("Cannot create self-message rule: User ID not available")
+                    # Filled in by RuleEngine.set_slack_client after login
+                    self._conditions.pop('sender', None)
+                    self._awaits_user_id = True
             else:
                 # Handle email or direct user ID
                 if '@' in identifier and self.engine.slack:
@@ -155,6 +387,7 @@ class RuleBuilder:
                         self._conditions['sender'] = identifier
                 else:
                     self._conditions['sender'] = identifier
+                self._awaits_user_id = False
             return self
         
     def when(self, name: str) -> 'RuleBuilder':
@@ -212,7 +445,7 @@ class RuleBuilder:
             'params': {
                 'message': message
             },
-            'priority': self._priority.value
+            'priority': self._priority.name
         })
         return self
         
@@ -230,7 +463,10 @@ class RuleBuilder:
             exceptions=self._exceptions
         )
         
-        self.engine.add_rule(rule)
+        if self._awaits_user_id:
+            self.engine.add_rule_awaiting_user_id(rule)
+        else:
+            self.engine.add_rule(rule)
         return rule
 
 class RuleSerializer:
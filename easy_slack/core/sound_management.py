@@ -1,11 +1,11 @@
 from dataclasses import dataclass
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, NamedTuple, Tuple, Hashable
+from collections import OrderedDict
 import logging
 from pathlib import Path
-import json
 from notifypy import Notify
 import threading
-import queue
+import heapq
 from .models import (
     NotifySound, 
     NotificationPriority, 
@@ -14,9 +14,58 @@ from .models import (
     NotificationProfile
 )
 from .accessibility import AccessibilityManager
+from ..utils.batcher import FlushQueue, IntervalPolicy
+from ..utils import jsonfast
 import platform
 import subprocess  # Add this line
 import time
+import itertools
+import re
+
+_MAX_NOTIFIED = 4096  # (message id, profile) pairs remembered for de-duplication
+_NOTIFIED_TTL = 300.0  # Seconds a pair stays remembered
+_MAX_CONTENT_SEEN = 2048  # Notification text fingerprints remembered
+_CONTENT_TTL = 60.0  # Seconds identical text is suppressed for
+_FINGERPRINT_NOISE = re.compile(r'https?://\S+|\d+')  # Ignored when comparing text
+
+SVSF_ASYNC = 1  # SAPI SpeechVoiceSpeakFlags: return before speaking finishes
+
+# NotifySound types mapped to macOS system sounds
+_MAC_SOUND_MAP = {
+    NotifySound.MESSAGE: "/System/Library/Sounds/Morse.aiff",    # Basic notification
+    NotifySound.MENTION: "/System/Library/Sounds/Ping.aiff",     # When mentioned
+    NotifySound.DM: "/System/Library/Sounds/Purr.aiff",          # Direct messages
+    NotifySound.URGENT: "/System/Library/Sounds/Glass.aiff",     # Urgent/important
+    NotifySound.SUCCESS: "/System/Library/Sounds/Bottle.aiff",   # Success events
+    NotifySound.WARNING: "/System/Library/Sounds/Basso.aiff"     # Warning events
+}
+
+def _remember(seen: "OrderedDict[Hashable, float]", key: Hashable, ttl: float, limit: int) -> bool:
+    """Record a key in a TTL cache, returning False if it was already there"""
+    # Entries share one TTL, so the expired ones are always at the front
+    now = time.monotonic()
+    while seen and next(iter(seen.values())) <= now:
+        seen.popitem(last=False)
+
+    if key in seen:
+        return False
+
+    # Remember the key, forgetting the oldest once full
+    seen[key] = now + ttl
+    if len(seen) > limit:
+        seen.popitem(last=False)
+    return True
+
+class PendingNotification(NamedTuple):
+    """A formatted notification waiting to be played"""
+    priority: int
+    timestamp: float
+    title: str
+    message: str
+    profile: NotificationProfile
+    sr_settings: Dict[str, Any]
+    sender_id: str
+    content: str
 
 class NotificationManager:
     """Manages system notifications with priority and status handling"""
@@ -26,19 +75,35 @@ class NotificationManager:
         self.config_dir = config_dir or Path.home() / '.easy_slack'
         self.config_dir.mkdir(exist_ok=True)
 
-        self._processed_notifications = set()
+        # Recently notified (message id, profile) pairs -> expiry, oldest first
+        self._processed_notifications: "OrderedDict[Tuple[str, Optional[str]], float]" = OrderedDict()
+        # Fingerprints of recently queued notification text -> expiry, oldest first
+        self._content_seen: "OrderedDict[int, float]" = OrderedDict()
+        self._seen_lock = threading.Lock()  # notify() runs on several executor threads
         self._notification_start_time = time.time()
         
         self.os_type = platform.system()
         
         # Initialize notification components
         self.profiles: Dict[str, NotificationProfile] = {}
+        self._profile_names: Optional[tuple] = None
         self.user_profiles: Dict[str, str] = {}  # user_id -> profile_name
         self.current_status = UserStatus.ACTIVE
         
-        # Queue for thread-safe notification handling
-        self.notification_queue = queue.PriorityQueue()
+        # Heap of pending notifications; the condition wakes the worker on push
+        self.notification_queue: List[tuple] = []
+        self._queue_cond = threading.Condition()
+        self._queue_order = itertools.count()  # Tie-breaker for equal priority/timestamp
         self.running = True
+        self._speech_proc: Optional[subprocess.Popen] = None  # espeak on Linux, started on first use
+        self._sapi = None  # SAPI.SpVoice on Windows, created on first use
+
+        # Non-critical notifications are collected briefly and played per sound
+        self._batcher = FlushQueue(
+            self._flush_notifications,
+            IntervalPolicy(max_wait_seconds=1.0, max_records=25),
+            dedupe_key=lambda n: (n.profile.name, n.sender_id, hash(n.content))
+        )
         
         # Load configuration
         self._load_config()
@@ -112,35 +177,11 @@ class NotificationManager:
     ) -> bool:
         """Create a custom notification profile with screen reader support"""
         try:
-            # Create default screen reader settings if none provided
-            if screen_reader_settings is None:
-                screen_reader_settings = {
-                    'voiceover': {
-                        'voice': 'Alex',
-                        'rate': 250,
-                        'pitch': 50,
-                        'sound': 'Glass'
-                    },
-                    'nvda': {
-                        'voice': 'Microsoft David',
-                        'rate': 50,
-                        'pitch': 50,
-                        'sound': True
-                    },
-                    'jaws': {
-                        'voice': 'Microsoft David',
-                        'rate': 50,
-                        'pitch': 50,
-                        'sound': 'MessageBeep'
-                    },
-                    'orca': {
-                        'voice': 'default',
-                        'rate': 50,
-                        'pitch': 50,
-                        'sound': 'message-new-instant'
-                    }
-                }
-                
+            # Without settings the profile's default_factory copies _DEFAULT_SR_SETTINGS
+            extra = {}
+            if screen_reader_settings is not None:
+                extra['screen_reader_settings'] = screen_reader_settings
+
             self.profiles[name] = NotificationProfile(
                 name=name,
                 sound_type=sound_type,
@@ -148,14 +189,22 @@ class NotificationManager:
                 message_template=message_template,
                 volume=volume,
                 priority=priority,
-                screen_reader_settings=screen_reader_settings
+                **extra
             )
+            self._profile_names = None
             self._save_config()
             return True
         except Exception as e:
             self.logger.error(f"Error creating profile: {e}")
             return False
 
+    @property
+    def profile_names(self) -> tuple:
+        """Names of all profiles, cached until a profile is created"""
+        if self._profile_names is None:
+            self._profile_names = tuple(self.profiles)
+        return self._profile_names
+
     def set_user_profile(self, user_id: str, profile_name: str) -> bool:
         """Assign notification profile to user"""
         if profile_name not in self.profiles:
@@ -171,16 +220,6 @@ class NotificationManager:
             if message.timestamp < self._notification_start_time:
                 return
                 
-            notification_key = f"{message.id}:{profile_name}"
-            if notification_key in self._processed_notifications:
-                return
-                
-            self._processed_notifications.add(notification_key)
-            
-            # Trim cache if it gets too large
-            if len(self._processed_notifications) > 1000:
-                self._processed_notifications.clear()
-
             # Get profile (user-specific, specified, or default)
             profile = self.profiles.get(
                 self.user_profiles.get(message.sender_id) or 
@@ -188,6 +227,7 @@ class NotificationManager:
                 "default"
             )
             
+            # Suppressed notifications return before any bookkeeping
             if not profile or not profile.enabled:
                 return
                 
@@ -195,42 +235,93 @@ class NotificationManager:
             if not profile.priority.can_break_through(self.current_status):
                 return
                 
+            with self._seen_lock:
+                if not _remember(self._processed_notifications, (message.id, profile_name),
+                                 _NOTIFIED_TTL, _MAX_NOTIFIED):
+                    return
+
             # Format notification
             title, msg = profile.format_message(message)
+
+            # Drop repeats of the same message from the same sender, e.g. bot or join
+            # spam; links and numbers are ignored in the rendered text only, and the
+            # content is kept whole because templates like "team" read the same for
+            # different messages
+            if profile.priority != NotificationPriority.CRITICAL:
+                rendered = _FINGERPRINT_NOISE.sub('', f"{title}|{msg}".lower())
+                fingerprint = hash((message.sender_id, rendered, message.content))
+                with self._seen_lock:
+                    if not _remember(self._content_seen, fingerprint, _CONTENT_TTL, _MAX_CONTENT_SEEN):
+                        return
             
             # Add to queue with priority
-            priority_value = {
-                NotificationPriority.LOW: 1,
-                NotificationPriority.MEDIUM: 2,
-                NotificationPriority.HIGH: 3,
-                NotificationPriority.CRITICAL: 4
-            }.get(profile.priority, 2)  # Default to MEDIUM if unknown
+            priority_value = profile.priority.rank
             
             # Get screen reader settings based on detected screen reader
-            reader_type = self.accessibility.screen_reader.value
+            reader_type = self.accessibility.screen_reader
             sr_settings = profile.screen_reader_settings.get(reader_type, {})
             
-            # Create notification tuple with screen reader settings
-            notification_data = (
-                title, 
-                msg, 
-                profile,
-                sr_settings  # Add screen reader settings to the tuple
-            )
-            
-            # Add to priority queue
-            priority_tuple = (
-                -priority_value,  # Negative so higher priorities come first
-                -int(message.timestamp),  # Convert timestamp to int
-                notification_data
+            notification = PendingNotification(
+                priority=priority_value,
+                timestamp=message.timestamp,
+                title=title,
+                message=msg,
+                profile=profile,
+                sr_settings=sr_settings,
+                sender_id=message.sender_id,
+                content=message.content
             )
-            
-            self.notification_queue.put(priority_tuple)
-            self.logger.debug(f"Queued notification with priority {priority_value}")
-            
+
+            # Critical notifications skip the batching window
+            if profile.priority == NotificationPriority.CRITICAL:
+                self._enqueue_now(notification)
+            else:
+                self.enqueue(notification)
+
         except Exception as e:
             self.logger.error(f"Error queuing notification: {e}")
 
+    def enqueue(self, notification: PendingNotification) -> bool:
+        """Add notification to the current batch, returning False if it was a duplicate"""
+        return self._batcher.put(notification)
+
+    def _flush_notifications(self, batch: List[PendingNotification]):
+        """Play a batch as one notification per sound type"""
+        groups: Dict[NotifySound, List[PendingNotification]] = {}
+        for notification in batch:
+            groups.setdefault(notification.profile.sound_type, []).append(notification)
+
+        for group in groups.values():
+            if len(group) == 1:
+                self._enqueue_now(group[0])
+                continue
+
+            lead = max(group, key=lambda n: n.priority)
+            lines = [
+                ": ".join(part for part in (n.title, n.message) if part)
+                for n in group
+            ]
+            self._enqueue_now(lead._replace(
+                timestamp=max(n.timestamp for n in group),
+                title=f"{len(group)} notifications",
+                message=". ".join(line for line in lines if line)
+            ))
+
+    def _enqueue_now(self, notification: PendingNotification):
+        """Put notification straight on the playback queue"""
+        priority_tuple = (
+            -notification.priority,  # Negative so higher priorities come first
+            -int(notification.timestamp),  # Convert timestamp to int
+            next(self._queue_order),
+            (notification.title, notification.message,
+             notification.profile, notification.sr_settings)
+        )
+
+        with self._queue_cond:
+            heapq.heappush(self.notification_queue, priority_tuple)
+            self._queue_cond.notify()
+        self.logger.debug(f"Queued notification with priority {notification.priority}")
+
     def set_status(self, status: UserStatus):
         """Update current status"""
         self.current_status = status
@@ -239,88 +330,101 @@ class NotificationManager:
     def _send_notification(self, title: str, message: str, profile: NotificationProfile, sr_settings: Dict[str, Any] = None):
         """Send notification with screen reader support"""
         try:
-            reader_type = self.accessibility.screen_reader.value
+            reader_type = self.accessibility.screen_reader
             
             # For VoiceOver/system speech
             if self.os_type == "Darwin":
                 try:
-                    # Map NotifySound types to system sounds
-                    sound_mapping = {
-                        NotifySound.MESSAGE: "/System/Library/Sounds/Morse.aiff",    # Basic notification
-                        NotifySound.MENTION: "/System/Library/Sounds/Ping.aiff",     # When mentioned
-                        NotifySound.DM: "/System/Library/Sounds/Purr.aiff",          # Direct messages
-                        NotifySound.URGENT: "/System/Library/Sounds/Glass.aiff",     # Urgent/important
-                        NotifySound.SUCCESS: "/System/Library/Sounds/Bottle.aiff",   # Success events
-                        NotifySound.WARNING: "/System/Library/Sounds/Basso.aiff"     # Warning events
-                    }
-                    
                     # Get appropriate sound file or use default
-                    sound_file = sound_mapping.get(profile.sound_type, "/System/Library/Sounds/Morse.aiff")
-                    subprocess.run(['afplay', sound_file])
+                    sound_file = _MAC_SOUND_MAP.get(profile.sound_type, "/System/Library/Sounds/Morse.aiff")
+                    if not self.accessibility.play_system_sound(Path(sound_file).name):
+                        self._play_detached(['afplay', sound_file])
                     
                 except Exception as e:
                     self.logger.error(f"Error playing sound: {e}")
                 
-                if reader_type != "none" and profile.message_template.strip():
-                    notification_text = f"{title}: {message}"
-                    apple_script = f'''
-                    tell application "VoiceOver"
-                        output "{notification_text}"
-                    end tell
-                    '''
-                    subprocess.run(['osascript', '-e', apple_script])
-
                 notification_text = f"{title}: {message}"
                 if reader_type == "voiceover":
-                    # Use VoiceOver if running
-                    apple_script = f'''
-                    tell application "VoiceOver"
-                        output "{notification_text}"
-                    end tell
-                    '''
-                    subprocess.run(['osascript', '-e', apple_script])
+                    # One VoiceOver announcement through the shared osascript session
+                    if profile.message_template.strip():
+                        self.accessibility.voiceover_output(notification_text)
                     # Play system sound if specified
                     if sr_settings and sr_settings.get('sound'):
-                        subprocess.run(['afplay', f'/System/Library/Sounds/{sr_settings["sound"]}.aiff'])
+                        sound_name = f'{sr_settings["sound"]}.aiff'
+                        if not self.accessibility.play_system_sound(sound_name):
+                            self._play_detached(['afplay', f'/System/Library/Sounds/{sound_name}'])
                 else:
                     # Use system speech if no screen reader
-                    subprocess.run(['say', notification_text])
+                    self.accessibility.say(notification_text)
                     
             # For Windows screen readers
             elif self.os_type == "Windows":
                 notification_text = f"{title}: {message}"
-                if reader_type == "nvda":
-                    import nvda_controller_client as nvda
-                    nvda.nvdaController.speakText(notification_text)
-                elif reader_type == "jaws":
-                    import win32com.client
-                    jaws = win32com.client.Dispatch("FreedomSci.JawsApi")
-                    jaws.SayString(notification_text)
-                else:
-                    # Use Windows speech
-                    import win32com.client
-                    speaker = win32com.client.Dispatch("SAPI.SpVoice")
-                    speaker.Speak(notification_text)
+                # NVDA/JAWS through their loaded APIs, SAPI when neither is running
+                if not self.accessibility.screen_reader_output(notification_text):
+                    # Use Windows speech without waiting for it to finish
+                    self._windows_voice().Speak(notification_text, SVSF_ASYNC)
                     
             # For Linux/Orca
             elif self.os_type == "Linux":
                 notification_text = f"{title}: {message}"
                 if reader_type == "orca":
-                    subprocess.run(['spd-say', notification_text])
+                    # Persistent speech-dispatcher client, or queued spd-say without it
+                    self.accessibility.speech_dispatcher_say(notification_text)
                 else:
                     # Use system speech
-                    subprocess.run(['espeak', notification_text])
+                    self._espeak(notification_text)
                     
         except Exception as e:
             self.logger.error(f"Error sending notification: {e}")
+
+    def _windows_voice(self):
+        """SAPI voice, created once on the worker thread that speaks with it"""
+        if self._sapi is None:
+            import win32com.client
+            self._sapi = win32com.client.Dispatch("SAPI.SpVoice")
+        return self._sapi
+
+    def _play_detached(self, cmd: List[str]):
+        """Start a sound player without waiting for it, so speech isn't held up"""
+        subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True
+        )
+
+    def _espeak(self, text: str):
+        """Speak through one long-lived espeak reading lines from stdin"""
+        try:
+            if self._speech_proc is None or self._speech_proc.poll() is not None:
+                self._speech_proc = subprocess.Popen(
+                    ['espeak'],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    bufsize=0
+                )
+            self._speech_proc.stdin.write(' '.join(text.split()).encode() + b'\n')
+        except OSError as e:
+            self.logger.error(f"espeak session error: {e}")
+            self._speech_proc = None
+            subprocess.run(['espeak', text])
+
     def _start_worker(self):
         """Start notification worker thread"""
         def notification_worker():
-            while self.running:
+            while True:
+                # Sleep until something is queued; bursts were already merged by the batcher
+                with self._queue_cond:
+                    while self.running and not self.notification_queue:
+                        self._queue_cond.wait()
+                    if not self.notification_queue:
+                        return  # Stopped and drained
+                    *_, (title, msg, profile, sr_settings) = heapq.heappop(self.notification_queue)
+
                 try:
-                    # Get next notification from queue
-                    _, _, (title, msg, profile, sr_settings) = self.notification_queue.get(timeout=0.1)
-                    
                     # Send notification with screen reader settings
                     self._send_notification(
                         title=title,
@@ -328,10 +432,6 @@ class NotificationManager:
                         profile=profile,
                         sr_settings=sr_settings
                     )
-                    
-                    self.notification_queue.task_done()
-                except queue.Empty:
-                    continue
                 except Exception as e:
                     self.logger.error(f"Notification worker error: {e}")
 
@@ -346,21 +446,24 @@ class NotificationManager:
         config_file = self.config_dir / 'notifications.json'
         try:
             if config_file.exists():
-                with open(config_file) as f:
-                    config = json.load(f)
+                config = jsonfast.loads(config_file.read_bytes())
                     
                 # Load profiles
                 for name, profile_data in config.get('profiles', {}).items():
-                    self.profiles[name] = NotificationProfile(
-                        name=name,
-                        sound_type=NotifySound[profile_data['sound_type']],
-                        title_template=profile_data['title_template'],
-                        message_template=profile_data['message_template'],
-                        volume=profile_data.get('volume', 1.0),
-                        enabled=profile_data.get('enabled', True),
-                        priority=NotificationPriority[profile_data.get(
-                            'priority', 'MEDIUM')]
-                    )
+                    # One bad profile is skipped rather than losing the rest of the file
+                    try:
+                        self.profiles[name] = NotificationProfile(
+                            name=name,
+                            sound_type=NotifySound[profile_data['sound_type']],
+                            title_template=profile_data['title_template'],
+                            message_template=profile_data['message_template'],
+                            volume=profile_data.get('volume', 1.0),
+                            enabled=profile_data.get('enabled', True),
+                            priority=NotificationPriority[profile_data.get(
+                                'priority', 'MEDIUM')]
+                        )
+                    except Exception as e:
+                        self.logger.error(f"Error loading profile {name}: {e}")
                     
                 # Load user profile assignments
                 self.user_profiles = config.get('user_profiles', {})
@@ -387,23 +490,25 @@ class NotificationManager:
             }
             
             config_file = self.config_dir / 'notifications.json'
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            config_file.write_text(jsonfast.dumps(config, indent=True))
                 
         except Exception as e:
             self.logger.error(f"Error saving config: {e}")
 
     def cleanup(self):
         """Clean up resources"""
-        self.running = False
+        self._batcher.flush()
+        with self._queue_cond:
+            self.running = False
+            self._queue_cond.notify()
         if hasattr(self, 'worker_thread'):
-            # Wait for queue to empty
-            self.notification_queue.join()
-            # Clear any remaining items
-            while not self.notification_queue.empty():
-                try:
-                    self.notification_queue.get_nowait()
-                    self.notification_queue.task_done()
-                except queue.Empty:
-                    break
+            # Worker plays what's left, then exits
+            self.worker_thread.join()
+        if self._speech_proc is not None:
+            try:
+                self._speech_proc.stdin.close()  # espeak exits after the last line
+            except OSError as e:
+                self.logger.error(f"Error stopping espeak: {e}")
+            self._speech_proc = None
+        self.accessibility.cleanup()
         self._save_config()
\ No newline at end of file
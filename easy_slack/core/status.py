@@ -1,16 +1,29 @@
 import asyncio
-from typing import Optional, List, Set
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Optional, List, Set, Deque, Callable, Tuple
 from .models import UserStatus, Message, NotificationBuffer
-from datetime import datetime
+
+STATUS_HISTORY_SIZE = 1024  # Status changes kept, oldest dropped first
 
 class StatusManager:
     """Manages user status and notification buffering"""
     
     def __init__(self):
+        self.logger = logging.getLogger("StatusManager")
         self.current_status = UserStatus.ACTIVE
         self.buffer = NotificationBuffer()
-        self.status_listeners = []
-        self._status_history = []
+        # Guards the buffer, which listeners read from the dispatch thread
+        self._buffer_lock = threading.RLock()
+        self.status_listeners: Deque[Callable[[UserStatus, UserStatus], None]] = deque()
+        # Listeners run on one background thread so set_status never waits on them
+        self._status_events: "queue.Queue[Optional[Tuple[UserStatus, UserStatus]]]" = queue.Queue()
+        self._dispatch_thread: Optional[threading.Thread] = None
+        self._dispatch_lock = threading.Lock()
+        self._status_history: Deque[Tuple[str, float]] = deque(maxlen=STATUS_HISTORY_SIZE)  # (status value, monotonic time)
         self._cleanup_handlers = []
 
     
@@ -29,7 +42,15 @@ class StatusManager:
             except Exception as e:
                 self.logger.error(f"Error in cleanup handler: {e}")
 
-        self.buffer.clear()
+        with self._dispatch_lock:
+            dispatch_thread = self._dispatch_thread
+            self._dispatch_thread = None
+        if dispatch_thread is not None:
+            self._status_events.put(None)  # Stop sentinel
+            await asyncio.to_thread(dispatch_thread.join)
+
+        with self._buffer_lock:
+            self.buffer.clear()
         self.status_listeners.clear()
         self._status_history.clear()
 
@@ -37,44 +58,69 @@ class StatusManager:
         """Set user status and optionally start buffering"""
         old_status = self.current_status
         self.current_status = status
-        self._status_history.append((status, datetime.now().timestamp()))
+        self._status_history.append((status.value, time.monotonic()))
         
         # Handle buffering
         if auto_buffer:
-            if status == UserStatus.FOCUSED or status == UserStatus.DND:
-                self.buffer.start_buffering()
-            elif old_status in (UserStatus.FOCUSED, UserStatus.DND):
-                self._flush_buffer()
-                
+            with self._buffer_lock:
+                if status == UserStatus.FOCUSED or status == UserStatus.DND:
+                    self.buffer.start_buffering()
+                elif old_status in (UserStatus.FOCUSED, UserStatus.DND):
+                    self._flush_buffer()
+
         # Notify listeners
-        for listener in self.status_listeners:
-            listener(old_status, status)
+        with self._dispatch_lock:
+            if self._dispatch_thread is None:
+                self._dispatch_thread = threading.Thread(
+                    target=self._dispatch_worker,
+                    daemon=True
+                )
+                self._dispatch_thread.start()
+        self._status_events.put((old_status, status))
+
+    def _dispatch_worker(self):
+        """Deliver each status change to listeners in order until stopped"""
+        while True:
+            event = self._status_events.get()
+            if event is None:
+                return
+            old_status, new_status = event
+            for listener in list(self.status_listeners):
+                try:
+                    listener(old_status, new_status)
+                except Exception as e:
+                    self.logger.error(f"Error in status listener: {e}")
 
     def add_buffer_exception(self, entity_id: str):
         """Add exception to notification buffering"""
-        self.buffer.exceptions.add(entity_id)
+        with self._buffer_lock:
+            self.buffer.exceptions.add(entity_id)
 
     def remove_buffer_exception(self, entity_id: str):
         """Remove exception from notification buffering"""
-        self.buffer.exceptions.discard(entity_id)
+        with self._buffer_lock:
+            self.buffer.exceptions.discard(entity_id)
 
     def should_buffer(self, message: Message) -> bool:
         """Check if message should be buffered"""
-        return self.buffer.add_message(message)
+        with self._buffer_lock:
+            return self.buffer.add_message(message)
 
     def _flush_buffer(self) -> List[Message]:
         """Stop buffering and return buffered messages"""
-        return self.buffer.stop_buffering()
+        with self._buffer_lock:
+            return self.buffer.stop_buffering()
 
     def get_buffer_summary(self) -> str:
         """Get summary of buffered messages"""
-        return self.buffer.get_summary()
+        with self._buffer_lock:
+            return self.buffer.get_summary()
 
     def get_status_duration(self) -> float:
         """Get duration of current status in seconds"""
         if not self._status_history:
             return 0.0
-        return datetime.now().timestamp() - self._status_history[-1][1]
+        return time.monotonic() - self._status_history[-1][1]
 
     def add_status_listener(self, listener):
         """Add listener for status changes"""
@@ -0,0 +1,71 @@
+import threading
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, List, Optional, Set
+
+@dataclass
+class IntervalPolicy:
+    """When a FlushQueue hands its records to the flush callback"""
+    max_wait_seconds: float = 1.0
+    max_records: int = 25
+
+class FlushQueue:
+    """Collects records and flushes them in batches by age or size"""
+
+    def __init__(self, flush: Callable[[List[Any]], None],
+                 policy: Optional[IntervalPolicy] = None,
+                 dedupe_key: Optional[Callable[[Any], Hashable]] = None):
+        self.logger = logging.getLogger("FlushQueue")
+        self.policy = policy or IntervalPolicy()
+        self._flush = flush
+        self._dedupe_key = dedupe_key
+        self._records: List[Any] = []
+        self._keys: Set[Hashable] = set()
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def put(self, record: Any) -> bool:
+        """Add a record, returning False if it duplicates one already waiting"""
+        batch = None
+        with self._lock:
+            if self._dedupe_key:
+                key = self._dedupe_key(record)
+                if key in self._keys:
+                    return False
+                self._keys.add(key)
+
+            self._records.append(record)
+            if len(self._records) >= self.policy.max_records:
+                batch = self._take()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.policy.max_wait_seconds, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if batch:
+            self._run(batch)
+        return True
+
+    def flush(self):
+        """Flush whatever is waiting right away"""
+        with self._lock:
+            batch = self._take()
+        if batch:
+            self._run(batch)
+
+    def _take(self) -> List[Any]:
+        """Take the waiting records and reset the window"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch = self._records
+        self._records = []
+        self._keys = set()
+        return batch
+
+    def _run(self, batch: List[Any]):
+        """Hand a batch to the flush callback"""
+        try:
+            self._flush(batch)
+        except Exception as e:
+            self.logger.error(f"Error flushing batch: {e}")
@@ -1,85 +1,303 @@
 import sqlite3
-from typing import Optional, Dict, List
-import json
+from typing import Optional, Dict, List, Tuple
+from collections import OrderedDict
+from operator import itemgetter
+from contextlib import contextmanager
 from pathlib import Path
 import logging
 import threading
+from . import jsonfast
+
+USER_CACHE_SIZE = 1024
+STATEMENT_CACHE_SIZE = 64  # Prepared statements sqlite3 keeps per connection, keyed by SQL text
+
+# Statements kept as constants so sqlite3's statement cache and Database._cursors reuse them
+_SQL_SAVE_CONFIG = 'INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)'
+_SQL_GET_CONFIG = 'SELECT value FROM config WHERE key = ?'
+_SQL_SAVE_USER = 'INSERT OR REPLACE INTO users (id, name, email, slack_id, role) VALUES (?, ?, ?, ?, ?)'
+# Slack-sourced users: refresh the row with the same email, else add one keyed
+# on the Slack ID; neither statement ever replaces a different user's row
+_SQL_REFRESH_SLACK_USER = (
+    'UPDATE users SET name = ?, slack_id = ? '
+    'WHERE email = ? AND (slack_id IS NULL OR slack_id = ?)'
+)
+_SQL_INSERT_SLACK_USER = 'INSERT OR IGNORE INTO users (id, name, email, slack_id) VALUES (?, ?, ?, ?)'
+_USER_COLUMNS = ('id', 'name', 'email', 'slack_id', 'role')  # Column order of the user SELECTs
+_SQL_USER_BY_EMAIL = f"SELECT {', '.join(_USER_COLUMNS)} FROM users WHERE email = ?"
+_SQL_USER_BY_SLACK_ID = f"SELECT {', '.join(_USER_COLUMNS)} FROM users WHERE slack_id = ?"
+_SQL_USERS_BY_ROLE = f"SELECT {', '.join(_USER_COLUMNS)} FROM users WHERE role = ?"
+_SQL_USERS_BY_SLACK_IDS = f"SELECT {', '.join(_USER_COLUMNS)} FROM users WHERE slack_id IN ({{}})"  # Filled with one ? per ID
+_SQL_SAVE_TAG = 'INSERT OR REPLACE INTO tags (type, entity_id, tag) VALUES (?, ?, ?)'
+_SQL_GET_TAGS = 'SELECT tag FROM tags WHERE type = ? AND entity_id = ?'
+_SQL_SAVE_RULE = (
+    'INSERT OR REPLACE INTO rules (id, name, conditions, actions, priority, enabled) '
+    'VALUES (?, ?, ?, ?, ?, ?)'
+)
+_SQL_GET_RULES = 'SELECT * FROM rules'
+_SQL_GET_ENABLED_RULES = 'SELECT * FROM rules WHERE enabled = 1'  # Served by idx_rules_on
+_SQL_GET_RULES_BULK = '''
+    SELECT
+        name,
+        COALESCE((SELECT key FROM json_each(rules.conditions) LIMIT 1), 'any'),
+        COALESCE((SELECT group_concat(key || '=' || value, ', ')
+                  FROM json_each(rules.conditions)), ''),
+        priority,
+        enabled
+    FROM rules
+'''
+_SQL_SAVE_SOUND_PROFILE = (
+    'INSERT OR REPLACE INTO sound_profiles (id, name, sound_file, volume, pitch, enabled) '
+    'VALUES (?, ?, ?, ?, ?, ?)'
+)
+_SQL_GET_SOUND_PROFILES = 'SELECT * FROM sound_profiles'
 
 class Database:
     """Database management for EasySlack"""
 
+    # Open databases keyed by path, so every Database(path) shares one connection
+    _instances: Dict[str, 'Database'] = {}
+    _instances_lock = threading.Lock()
+
+    def __new__(cls, db_path: str):
+        key = str(db_path)
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = super().__new__(cls)
+                cls._instances[key] = instance
+            return instance
+
     def __init__(self, db_path: str):
+        if getattr(self, '_initialized', False):
+            with self._lock:
+                self._refs += 1
+            return
         self.db_path = db_path
         self.logger = logging.getLogger("Database")
-        self._connection = None
-        self._lock = threading.Lock()
+        self._writer_conn = None
+        self._cursors: Dict[str, sqlite3.Cursor] = {}  # SQL constant -> reused cursor on the writer
+        self._lock = threading.RLock()  # Held for every statement on the writer connection
+        self._refs = 1  # Database(path) calls not yet matched by close()
+        self._tls = threading.local()  # Per-thread read-only connection and its cursors
+        self._readers: List[sqlite3.Connection] = []  # Every open reader, so close() can reach them
+        self._readers_lock = threading.Lock()
+        self._generation = 0  # Bumped by close() so threads reopen their reader
+        self._column_names: Dict[str, Tuple[str, ...]] = {}  # SQL constant -> result column names
+        self._batch_depth = 0  # Open write_batch blocks; only the lock holder can change it
+        self._batch_owner: Optional[int] = None  # Thread running the open write_batch
+        # email / slack_id -> user row (None for misses), least recently used first;
+        # used from the loop, to_thread workers and the notify pool, so guarded
+        self._cache_lock = threading.Lock()
+        self._user_cache_version = 0  # Bumped on invalidation so racing lookups don't store stale rows
+        self._users_by_email: "OrderedDict[str, Optional[Dict]]" = OrderedDict()
+        self._users_by_slack_id: "OrderedDict[str, Optional[Dict]]" = OrderedDict()
+        self._tokens: Optional[Dict[str, str]] = None
+        self._tokens_cached = False
+        # rule id -> (conditions text, actions text, parsed conditions, parsed actions)
+        self._rules_cache: Dict[str, Tuple[str, str, Dict, List[Dict]]] = {}
         self._init_db()
+        self._initialized = True
 
     def _get_connection(self):
-        """Get database connection with thread safety"""
+        """Get the writer connection with thread safety"""
+        with self._lock:
+            if self._writer_conn is None:
+                # Autocommit; multi-statement writes open their own transaction in write_batch
+                self._writer_conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                                    isolation_level=None,
+                                                    cached_statements=STATEMENT_CACHE_SIZE)
+                # WAL lets readers on other connections run alongside the writer
+                self._writer_conn.executescript('''
+                    PRAGMA journal_mode=WAL;
+                    PRAGMA synchronous=NORMAL;
+                    PRAGMA busy_timeout=5000;
+                    PRAGMA cache_size=-20000;
+                    PRAGMA temp_store=MEMORY;
+                    PRAGMA foreign_keys=ON;
+                ''')
+            return self._writer_conn
+
+    def _get_reader(self) -> sqlite3.Connection:
+        """Get this thread's read-only connection, opening it on first use"""
+        tls = self._tls
+        if getattr(tls, 'generation', None) != self._generation:
+            if self._writer_conn is None:
+                self._get_connection()  # The writer creates the file and switches it to WAL
+            conn = sqlite3.connect(f"{Path(self.db_path).resolve().as_uri()}?mode=ro", uri=True,
+                                   check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+            conn.executescript('''
+                PRAGMA busy_timeout=5000;
+                PRAGMA cache_size=-20000;
+                PRAGMA temp_store=MEMORY;
+            ''')
+            # Not the writer lock, which an open write_batch on another thread may hold
+            with self._readers_lock:
+                self._readers.append(conn)
+                tls.generation = self._generation
+            tls.conn = conn
+            tls.cursors = {}
+        return tls.conn
+
+    def _execute(self, sql: str, params=()) -> sqlite3.Cursor:
+        """Run one of the constant statements on its own reused writer cursor; call with the lock held"""
+        cursor = self._cursors.get(sql)
+        if cursor is None:
+            cursor = self._cursors[sql] = self._get_connection().cursor()
+        return cursor.execute(sql, params)
+
+    def _in_own_batch(self) -> bool:
+        """Check if the calling thread has a write_batch open"""
+        return self._batch_depth > 0 and self._batch_owner == threading.get_ident()
+
+    def _query(self, sql: str, params=()) -> sqlite3.Cursor:
+        """Run one of the constant statements on this thread's reader, without the writer lock"""
+        if self._in_own_batch():
+            # Only the writer can see what the open batch has written
+            return self._execute(sql, params)
+        conn = self._get_reader()
+        cursor = self._tls.cursors.get(sql)
+        if cursor is None:
+            cursor = self._tls.cursors[sql] = conn.cursor()
+        return cursor.execute(sql, params)
+
+    def _query_dicts(self, sql: str, params=()) -> List[Dict]:
+        """Run a constant statement and return its rows as column -> value dicts"""
+        cursor = self._query(sql, params)
+        columns = self._columns(sql, cursor)
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def _query_dict(self, sql: str, params=()) -> Optional[Dict]:
+        """Run a constant statement and return its first row as a dict, or None"""
+        cursor = self._query(sql, params)
+        # fetchall runs the statement to completion, so the reused cursor doesn't keep a read open
+        rows = cursor.fetchall()
+        return dict(zip(self._columns(sql, cursor), rows[0])) if rows else None
+
+    def _columns(self, sql: str, cursor: sqlite3.Cursor) -> Tuple[str, ...]:
+        """Column names of a constant statement, read from the cursor once"""
+        columns = self._column_names.get(sql)
+        if columns is None:
+            columns = self._column_names[sql] = tuple(d[0] for d in cursor.description)
+        return columns
+
+    @contextmanager
+    def write_batch(self):
+        """Run every write inside the block as one transaction, committed once at the end"""
+        conn = self._get_connection()
         with self._lock:
-            if self._connection is None:
-                self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
-            return self._connection
+            if self._batch_depth:
+                # Nested, the outer block commits
+                self._batch_depth += 1
+                try:
+                    yield
+                finally:
+                    self._batch_depth -= 1
+                return
+
+            conn.execute("BEGIN IMMEDIATE")
+            self._batch_depth = 1
+            self._batch_owner = threading.get_ident()
+            try:
+                yield
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:  # SQLite may already have rolled back
+                    conn.execute("ROLLBACK")
+                raise
+            finally:
+                self._batch_depth = 0
+                self._batch_owner = None
+
+    @contextmanager
+    def _write(self):
+        """Hold the lock for one write statement, which commits itself unless a write_batch is open"""
+        conn = self._get_connection()
+        with self._lock:
+            yield conn
+
+    def close(self):
+        """Release this user's reference, closing the connections once nobody holds one"""
+        with self._lock:
+            self._refs = max(self._refs - 1, 0)
+            if self._refs:
+                return  # Other sessions still share the connections
+            if self._writer_conn is not None:
+                self._cursors.clear()
+                self._writer_conn.close()
+                self._writer_conn = None
+            with self._readers_lock:
+                for reader in self._readers:
+                    reader.close()
+                self._readers.clear()
+                self._generation += 1
 
     def _init_db(self):
         """Initialize database schema"""
         try:
             conn = self._get_connection()
-            conn.executescript('''
-                    -- Users table
-                    CREATE TABLE IF NOT EXISTS users (
-                        id TEXT PRIMARY KEY,
-                        name TEXT NOT NULL,
-                        email TEXT UNIQUE NOT NULL,
-                        slack_id TEXT UNIQUE,
-                        role TEXT
-                    );
-
-                    -- Sound profiles
-                    CREATE TABLE IF NOT EXISTS sound_profiles (
-                        id TEXT PRIMARY KEY,
-                        name TEXT NOT NULL,
-                        sound_file TEXT NOT NULL,
-                        volume REAL DEFAULT 1.0,
-                        pitch REAL DEFAULT 1.0,
-                        enabled INTEGER DEFAULT 1
-                    );
-
-                    -- Entity profiles (users/roles -> sound profiles)
-                    CREATE TABLE IF NOT EXISTS entity_profiles (
-                        entity_type TEXT,
-                        entity_id TEXT,
-                        profile_id TEXT,
-                        PRIMARY KEY (entity_type, entity_id),
-                        FOREIGN KEY (profile_id) REFERENCES sound_profiles(id)
-                    );
-
-                    -- Tags
-                    CREATE TABLE IF NOT EXISTS tags (
-                        type TEXT,
-                        entity_id TEXT,
-                        tag TEXT,
-                        PRIMARY KEY (type, entity_id, tag)
-                    );
-
-                    -- Notification rules
-                    CREATE TABLE IF NOT EXISTS rules (
-                        id TEXT PRIMARY KEY,
-                        name TEXT NOT NULL,
-                        conditions TEXT NOT NULL,  -- JSON
-                        actions TEXT NOT NULL,     -- JSON
-                        priority TEXT NOT NULL,
-                        enabled INTEGER DEFAULT 1
-                    );
-
-                    -- Configuration
-                    CREATE TABLE IF NOT EXISTS config (
-                        key TEXT PRIMARY KEY,
-                        value TEXT
-                    );
-                ''')
-            conn.commit()
+            with self._lock:
+                conn.executescript('''
+                        -- Users table
+                        CREATE TABLE IF NOT EXISTS users (
+                            id TEXT PRIMARY KEY,
+                            name TEXT NOT NULL,
+                            email TEXT UNIQUE NOT NULL,
+                            slack_id TEXT UNIQUE,
+                            role TEXT
+                        );
+
+                        -- Sound profiles
+                        CREATE TABLE IF NOT EXISTS sound_profiles (
+                            id TEXT PRIMARY KEY,
+                            name TEXT NOT NULL,
+                            sound_file TEXT NOT NULL,
+                            volume REAL DEFAULT 1.0,
+                            pitch REAL DEFAULT 1.0,
+                            enabled INTEGER DEFAULT 1
+                        );
+
+                        -- Entity profiles (users/roles -> sound profiles)
+                        CREATE TABLE IF NOT EXISTS entity_profiles (
+                            entity_type TEXT,
+                            entity_id TEXT,
+                            profile_id TEXT,
+                            PRIMARY KEY (entity_type, entity_id),
+                            FOREIGN KEY (profile_id) REFERENCES sound_profiles(id)
+                        );
+
+                        -- Tags
+                        CREATE TABLE IF NOT EXISTS tags (
+                            type TEXT,
+                            entity_id TEXT,
+                            tag TEXT,
+                            PRIMARY KEY (type, entity_id, tag)
+                        );
+
+                        -- Notification rules
+                        CREATE TABLE IF NOT EXISTS rules (
+                            id TEXT PRIMARY KEY,
+                            name TEXT NOT NULL,
+                            conditions TEXT NOT NULL,  -- JSON
+                            actions TEXT NOT NULL,     -- JSON
+                            priority TEXT NOT NULL,
+                            enabled INTEGER DEFAULT 1 CHECK (enabled IN (0, 1))
+                        );
+
+                        -- Configuration
+                        CREATE TABLE IF NOT EXISTS config (
+                            key TEXT PRIMARY KEY,
+                            value TEXT
+                        );
+
+                        -- Lookups not covered by a primary key; users.email/slack_id and
+                        -- tags(type, entity_id) already search their UNIQUE/PRIMARY KEY indexes
+                        CREATE INDEX IF NOT EXISTS idx_entity_profiles_profile ON entity_profiles(profile_id);
+                        CREATE INDEX IF NOT EXISTS idx_rules_on ON rules(id) WHERE enabled = 1;
+                        CREATE INDEX IF NOT EXISTS idx_users_role ON users(role);
+
+                        -- Refresh planner statistics so the indexes get used
+                        ANALYZE;
+                    ''')
 
         except sqlite3.Error as e:
             self.logger.error(f"Database initialization error: {str(e)}")
@@ -87,142 +305,199 @@ class Database:
 
     def save_tokens(self, bot_token: str, app_token: str, user_token: str = None):
         """Save Slack tokens"""
-        tokens = json.dumps({
+        tokens = jsonfast.dumps({
             'bot_token': bot_token,
             'app_token': app_token,
             'user_token': user_token  # New: user token
         })
 
-        conn = self._get_connection()
-        conn.execute('''
-            INSERT OR REPLACE INTO config (key, value)
-            VALUES (?, ?)
-        ''', ('tokens', tokens))
-        conn.commit()
+        with self._write():
+            self._execute(_SQL_SAVE_CONFIG, ('tokens', tokens))
+        self._tokens_cached = False
 
     def get_tokens(self) -> Optional[Dict[str, str]]:
         """Get Slack tokens"""
-        conn = self._get_connection()
-        result = conn.execute('''
-            SELECT value FROM config WHERE key = ?
-        ''', ('tokens',)).fetchone()
+        if self._tokens_cached:
+            return dict(self._tokens) if self._tokens else None
 
-        if result:
-            return json.loads(result[0])
-        return None
+        rows = self._query(_SQL_GET_CONFIG, ('tokens',)).fetchall()
+        tokens = jsonfast.loads(rows[0][0]) if rows else None
+        if not self._batch_depth:  # Uncommitted rows could still roll back or be unseen
+            self._tokens = tokens
+            self._tokens_cached = True
+        return dict(tokens) if tokens else None
 
     def add_user(self, name: str, email: str, slack_id: Optional[str] = None,
                  role: Optional[str] = None) -> str:
         """Add or update user"""
-        user_id = f"U{email.split('@')[0]}"
+        user_id = 'U' + email.partition('@')[0]
 
-        conn = self._get_connection()
-        conn.execute('''
-            INSERT OR REPLACE INTO users (id, name, email, slack_id, role)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (user_id, name, email, slack_id, role))
-        conn.commit()
+        with self._write():
+            self._execute(_SQL_SAVE_USER, (user_id, name, email, slack_id, role))
 
+        self.invalidate_user_cache(email)
+        if slack_id:
+            self.invalidate_user_cache(slack_id)
         return user_id
 
+    def remember_slack_user(self, name: str, email: str, slack_id: str):
+        """Store a user looked up from Slack, keeping any existing row's id and role"""
+        with self._write():
+            if not self._execute(_SQL_REFRESH_SLACK_USER, (name, slack_id, email, slack_id)).rowcount:
+                self._execute(_SQL_INSERT_SLACK_USER, (slack_id, name, email, slack_id))
+
+        self.invalidate_user_cache(email)
+        self.invalidate_user_cache(slack_id)
+
     def get_user_by_email(self, email: str) -> Optional[Dict]:
         """Get user by email"""
-        conn = self._get_connection()
-        conn.row_factory = sqlite3.Row
-        result = conn.execute('''
-            SELECT * FROM users WHERE email = ?
-        ''', (email,)).fetchone()
-
-        if result:
-            return dict(result)
-        return None
+        return self._lookup_user(self._users_by_email, _SQL_USER_BY_EMAIL, email)
 
     def get_user_by_slack_id(self, slack_id: str) -> Optional[Dict]:
         """Get user by Slack ID"""
-        conn = self._get_connection()
-        conn.row_factory = sqlite3.Row
-        result = conn.execute('''
-            SELECT * FROM users WHERE slack_id = ?
-        ''', (slack_id,)).fetchone()
+        return self._lookup_user(self._users_by_slack_id, _SQL_USER_BY_SLACK_ID, slack_id)
+
+    def _lookup_user(self, cache: "OrderedDict[str, Optional[Dict]]", sql: str, key: str) -> Optional[Dict]:
+        """Get a user row through one of the LRU caches, querying on a miss"""
+        with self._cache_lock:
+            if key in cache:
+                cache.move_to_end(key)
+                user = cache[key]
+                return dict(user) if user else None
+            version = self._user_cache_version
+
+        user = self._query_dict(sql, (key,))
+        # While a batch is open its rows may still roll back, and other threads
+        # can't see them yet, so nothing read then is cached
+        if not self._batch_depth:
+            with self._cache_lock:
+                if version == self._user_cache_version:
+                    self._cache_user(cache, key, user)
+        return dict(user) if user else None
+
+    def get_users_by_slack_ids(self, slack_ids: List[str]) -> Dict[str, Dict]:
+        """Get users for several Slack IDs in one query, keyed by Slack ID"""
+        slack_ids = list(slack_ids)
+        if not slack_ids:
+            return {}
+
+        placeholders = ','.join('?' * len(slack_ids))
+        conn = self._get_connection() if self._in_own_batch() else self._get_reader()
+        cursor = conn.execute(_SQL_USERS_BY_SLACK_IDS.format(placeholders), slack_ids)
+
+        users = (dict(zip(_USER_COLUMNS, row)) for row in cursor.fetchall())
+        return {user['slack_id']: user for user in users}
+
+    def get_users_by_role(self, role: str) -> List[Dict]:
+        """Get every user with a role"""
+        return self._query_dicts(_SQL_USERS_BY_ROLE, (role,))
+
+    def invalidate_user_cache(self, email_or_id: Optional[str] = None):
+        """Drop cached lookups for an email or Slack ID, or every cached user if none given"""
+        with self._cache_lock:
+            self._user_cache_version += 1
+            if email_or_id is None:
+                self._users_by_email.clear()
+                self._users_by_slack_id.clear()
+                return
 
-        if result:
-            return dict(result)
-        return None
+            for cache in (self._users_by_email, self._users_by_slack_id):
+                user = cache.pop(email_or_id, None)
+                if user:
+                    # Forget the same row under its other key too
+                    self._users_by_email.pop(user['email'], None)
+                    self._users_by_slack_id.pop(user['slack_id'], None)
+
+    def _cache_user(self, cache: "OrderedDict[str, Optional[Dict]]", key: str, user: Optional[Dict]):
+        """Store a user lookup, evicting the least recently used entry when full; call with _cache_lock held"""
+        if len(cache) >= USER_CACHE_SIZE:
+            cache.popitem(last=False)
+        cache[key] = user
 
     def add_tag(self, type: str, entity_id: str, tag: str):
         """Add tag to entity"""
-        conn = self._get_connection()
-        conn.execute('''
-            INSERT OR REPLACE INTO tags (type, entity_id, tag)
-            VALUES (?, ?, ?)
-        ''', (type, entity_id, tag))
-        conn.commit()
+        self.add_tags_many(type, entity_id, [tag])
+
+    def add_tags_many(self, type: str, entity_id: str, tags: List[str]):
+        """Add several tags to one entity in one transaction"""
+        self.add_tags([(type, entity_id, tag) for tag in tags])
+
+    def add_tags(self, tags: List[Tuple[str, str, str]]):
+        """Add several (type, entity_id, tag) rows in one transaction"""
+        with self.write_batch(), self._write() as conn:
+            conn.executemany(_SQL_SAVE_TAG, tags)
 
     def get_tags(self, type: str, entity_id: str) -> List[str]:
         """Get tags for entity"""
-        conn = self._get_connection()
-        cursor = conn.execute('''
-            SELECT tag FROM tags
-            WHERE type = ? AND entity_id = ?
-        ''', (type, entity_id))
-        return [row[0] for row in cursor.fetchall()]
+        return list(map(itemgetter(0), self._query(_SQL_GET_TAGS, (type, entity_id))))
 
     def save_rule(self, rule_id: str, name: str, conditions: Dict,
                  actions: List[Dict], priority: str, enabled: bool = True):
         """Save notification rule"""
-        conn = self._get_connection()
-        conn.execute('''
-            INSERT OR REPLACE INTO rules
-            (id, name, conditions, actions, priority, enabled)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
-            rule_id, name,
-            json.dumps(conditions),
-            json.dumps(actions),
-            priority,
-            1 if enabled else 0
-        ))
-        conn.commit()
-
-    def get_rules(self) -> List[Dict]:
-        """Get all notification rules"""
-        conn = self._get_connection()
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute('SELECT * FROM rules').fetchall()
-
-        return [
-            {
-                **dict(row),
-                'conditions': json.loads(row['conditions']),
-                'actions': json.loads(row['actions']),
-                'enabled': bool(row['enabled'])
-            }
-            for row in rows
-        ]
+        with self._write():
+            self._execute(_SQL_SAVE_RULE, (
+                rule_id, name,
+                jsonfast.dumps(conditions),
+                jsonfast.dumps(actions),
+                priority,
+                1 if enabled else 0
+            ))
+        self._rules_cache.pop(rule_id, None)
+
+    def save_rules(self, rules: List[Tuple[str, str, Dict, List[Dict], str, bool]]):
+        """Save several (id, name, conditions, actions, priority, enabled) rules in one transaction"""
+        with self.write_batch(), self._write() as conn:
+            conn.executemany(_SQL_SAVE_RULE, [
+                (rule_id, name, jsonfast.dumps(conditions), jsonfast.dumps(actions),
+                 priority, 1 if enabled else 0)
+                for rule_id, name, conditions, actions, priority, enabled in rules
+            ])
+        for rule in rules:
+            self._rules_cache.pop(rule[0], None)
+
+    def get_rules(self, only_enabled: bool = False) -> List[Dict]:
+        """Get all notification rules, or only the enabled ones (parsed JSON is shared, don't mutate it)"""
+        rules = self._query_dicts(_SQL_GET_ENABLED_RULES if only_enabled else _SQL_GET_RULES)
+
+        for rule in rules:
+            conditions_text, actions_text = rule['conditions'], rule['actions']
+            cached = self._rules_cache.get(rule['id'])
+            if cached is None or cached[0] != conditions_text or cached[1] != actions_text:
+                # Only decode rows whose JSON changed since the last read
+                cached = (conditions_text, actions_text,
+                          jsonfast.loads(conditions_text), jsonfast.loads(actions_text))
+                self._rules_cache[rule['id']] = cached
+            rule['conditions'] = cached[2]
+            rule['actions'] = cached[3]
+            rule['enabled'] = bool(rule['enabled'])
+        return rules
+
+    def get_rules_bulk(self) -> List[Tuple[str, str, str, str, bool]]:
+        """Get (name, type, conditions, priority, enabled) display rows for all rules"""
+        rows = self._query(_SQL_GET_RULES_BULK).fetchall()
+
+        return [(name, type_, conditions, priority, bool(enabled))
+                for name, type_, conditions, priority, enabled in rows]
 
     def save_sound_profile(self, profile_id: str, name: str,
                          sound_file: str, volume: float = 1.0,
                          pitch: float = 1.0, enabled: bool = True):
         """Save sound profile"""
-        conn = self._get_connection()
-        conn.execute('''
-            INSERT OR REPLACE INTO sound_profiles
-            (id, name, sound_file, volume, pitch, enabled)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (profile_id, name, sound_file, volume, pitch,
-             1 if enabled else 0))
-        conn.commit()
+        with self._write():
+            self._execute(_SQL_SAVE_SOUND_PROFILE, (profile_id, name, sound_file, volume, pitch,
+                                                    1 if enabled else 0))
+
+    def save_sound_profiles(self, profiles: List[Tuple[str, str, str, float, float, bool]]):
+        """Save several (id, name, sound_file, volume, pitch, enabled) profiles in one transaction"""
+        with self.write_batch(), self._write() as conn:
+            conn.executemany(_SQL_SAVE_SOUND_PROFILE, [
+                (profile_id, name, sound_file, volume, pitch, 1 if enabled else 0)
+                for profile_id, name, sound_file, volume, pitch, enabled in profiles
+            ])
 
     def get_sound_profiles(self) -> List[Dict]:
         """Get all sound profiles"""
-        conn = self._get_connection()
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute('SELECT * FROM sound_profiles').fetchall()
-
-        return [
-            {
-                **dict(row),
-                'enabled': bool(row['enabled'])
-            }
-            for row in rows
-        ]
\ No newline at end of file
+        profiles = self._query_dicts(_SQL_GET_SOUND_PROFILES)
+        for profile in profiles:
+            profile['enabled'] = bool(profile['enabled'])
+        return profiles
\ No newline at end of file
@@ -0,0 +1,20 @@
+import asyncio
+from typing import Any, Coroutine
+
+# The "fast" extra swaps in the libuv event loop; asyncio covers installs without it
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a new event loop, libuv-based when uvloop is installed"""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion on a new event loop"""
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
@@ -0,0 +1,22 @@
+import json
+from typing import Any, Union
+
+# orjson encodes and decodes several times faster; the stdlib covers installs without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Encode to a JSON string, two-space indented if asked"""
+    if orjson is not None:
+        # Non-str keys are stringified like the stdlib does instead of raising
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON string or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,42 @@
+import threading
+import time
+from typing import Dict, Tuple
+import logging
+
+class RateLimiter:
+    """In-memory token bucket limiter for Slack API calls, one bucket per endpoint family"""
+
+    def __init__(self, capacity: int = 25, rate: float = 1.0):
+        self.logger = logging.getLogger("RateLimiter")
+        self.capacity = capacity
+        self.rate = rate  # Tokens refilled per second
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # family -> (tokens, last_refill)
+        self._lock = threading.Lock()
+
+    def allow_request(self, family: str, tokens_required: int = 1) -> bool:
+        """Take tokens from the family's bucket if enough are available"""
+        with self._lock:
+            return self._take(family, tokens_required) == 0.0
+
+    def acquire(self, family: str, tokens_required: int = 1):
+        """Block until the family's bucket can serve the request"""
+        while True:
+            with self._lock:
+                wait = self._take(family, tokens_required)
+            if wait == 0.0:
+                return
+            self.logger.debug(f"Rate limited on {family}, waiting {wait:.2f}s")
+            time.sleep(wait)
+
+    def _take(self, family: str, tokens_required: int) -> float:
+        """Refill and take tokens, returning 0 on success or seconds to wait otherwise"""
+        now = time.monotonic()
+        tokens, last_refill = self._buckets.get(family, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - last_refill) * self.rate)
+
+        if tokens >= tokens_required:
+            self._buckets[family] = (tokens - tokens_required, now)
+            return 0.0
+
+        self._buckets[family] = (tokens, now)
+        return (tokens_required - tokens) / self.rate
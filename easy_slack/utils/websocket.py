@@ -1,5 +1,7 @@
 import asyncio
-from typing import Dict, Optional, Callable, Any, List
+import re
+from functools import partial
+from typing import Dict, Optional, Callable, Any, List, Set
 import logging
 from slack_sdk.socket_mode import SocketModeClient
 from slack_sdk.socket_mode.response import SocketModeResponse
@@ -8,57 +10,57 @@ from slack_sdk.web import WebClient
 from ..core.models import Message
 from ..core.enums import MessageType  # Add this import
 
+_MENTION_RE = re.compile(r'<@([A-Z0-9]+)>', re.ASCII)
+EVENT_QUEUE_SIZE = 1024  # Events waiting for the loop before new ones are dropped
+EVENT_CONCURRENCY = 32  # Handlers running at once; one slow sender lookup no longer stalls the rest
+
 # In websocket.py
 
 class SlackEventHandler:
     """Handles real-time Slack events via WebSocket"""
     
-    def __init__(self, app_token: str, bot_token: str):
+    def __init__(self, app_token: str, bot_token: str,
+                 web_client: Optional[WebClient] = None,
+                 user_name_resolver: Optional[Callable[[str], str]] = None):
         self.logger = logging.getLogger("SlackEvents")
-        self.web_client = WebClient(token=bot_token)
+        self.web_client = web_client or WebClient(token=bot_token)
+        # Shared cached lookup (EasySlack's); without one, names are cached here
+        self._user_name_resolver = user_name_resolver
+        self._user_names: Dict[str, str] = {}
         self.socket_client = SocketModeClient(
             app_token=app_token,
             web_client=self.web_client
         )
-        self._message_handler: Optional[Callable] = None
-        self._presence_handler: Optional[Callable] = None
-        self._status_handler: Optional[Callable] = None
+        self._handlers: Dict[str, Callable] = {}  # Slack event type -> coroutine handler
         
         self._connected = False
         self._running = False
         self._loop = None
+        self._event_queue: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
+        self._dispatch_slots: Optional[asyncio.Semaphore] = None
+        self._dispatch_tasks: Set[asyncio.Task] = set()
+        # Latest handler task per channel, so one channel's events still run in order
+        self._channel_tails: Dict[str, asyncio.Task] = {}
 
     async def start(self):
         if self._running:
             return
 
         self._running = True
-        self._loop = asyncio.get_event_loop()
+        self._loop = asyncio.get_running_loop()
+        self._event_queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self._dispatch_slots = asyncio.Semaphore(EVENT_CONCURRENCY)
+        self._drain_task = self._loop.create_task(self._drain())
 
         def handle_events(client, req):
             if not self._running:
                 return
             if req.type == "events_api":
                 event = req.payload["event"]
-                event_type = event["type"]
-                try:
-                    if event_type == "message" and self._message_handler:
-                        asyncio.run_coroutine_threadsafe(
-                            self._message_handler(event),  # Pass the raw event
-                            self._loop
-                        )
-                    elif event_type == "presence_change" and self._presence_handler:
-                        asyncio.run_coroutine_threadsafe(
-                            self._presence_handler(event),
-                            self._loop
-                        )
-                    elif event_type == "user_status_changed" and self._status_handler:
-                        asyncio.run_coroutine_threadsafe(
-                            self._status_handler(event),
-                            self._loop
-                        )
-                except Exception as e:
-                    self.logger.error(f"Error handling event: {e}")
+                if event["type"] in self._handlers:
+                    # One scheduler poke per event instead of a cross-thread Future
+                    self._loop.call_soon_threadsafe(self._enqueue, event)
 
         try:
             self.socket_client.socket_mode_request_listeners.clear()
@@ -75,38 +77,91 @@ class SlackEventHandler:
             self.logger.error(f"WebSocket error: {e}")
             self._running = False
     
+    def _enqueue(self, event: dict):
+        """Queue an event on the loop thread, dropping it if the queue is full"""
+        try:
+            self._event_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.logger.error(f"Event queue full, dropping {event.get('type')} event")
+
+    async def _drain(self):
+        """Start a handler task for each queued event, a bounded number at a time"""
+        queue = self._event_queue
+        while self._running:
+            event = await queue.get()
+            await self._dispatch_slots.acquire()
+            channel = event.get('channel')
+            previous = self._channel_tails.get(channel) if channel else None
+            task = self._loop.create_task(self._dispatch(event, previous))
+            self._dispatch_tasks.add(task)
+            task.add_done_callback(partial(self._dispatch_done, channel))
+            if channel:
+                self._channel_tails[channel] = task
+
+    def _dispatch_done(self, channel: Optional[str], task: asyncio.Task):
+        """Free the finished handler's slot and forget it"""
+        self._dispatch_tasks.discard(task)
+        self._dispatch_slots.release()
+        if channel and self._channel_tails.get(channel) is task:
+            del self._channel_tails[channel]
+
+    async def _dispatch(self, event: dict, previous: Optional[asyncio.Task] = None):
+        """Run the registered handler for one event, after the channel's previous one"""
+        if previous is not None:
+            await asyncio.wait([previous])
+        handler = self._handlers.get(event["type"])
+        if handler is None:
+            return
+        try:
+            await handler(event)  # Pass the raw event
+        except Exception as e:
+            self.logger.error(f"Error handling event: {e}")
+
     def _convert_slack_message(self, event: dict) -> Message:
         """Convert Slack event to internal message format"""
+        text = event.get('text') or ''
+        user_id = event.get('user', '')
+        thread_ts = event.get('thread_ts')
+        # Plain channel chatter has no "<@", so the mention checks can be skipped
+        has_mentions = '<@' in text
+
         msg_type = MessageType.CHANNEL  # Now using MessageType enum
-        
         if event.get('channel_type') == 'im':
-            if event.get('user') == event.get('channel'):  # Message to self
+            if user_id == event.get('channel'):  # Message to self
                 msg_type = MessageType.DIRECT
-        elif event.get('thread_ts'):
+        elif thread_ts:
             msg_type = MessageType.THREAD
-        elif f'<@{event.get("user")}>' in event.get('text', ''):
+        elif has_mentions and user_id and f'<@{user_id}>' in text:
             msg_type = MessageType.MENTION
 
         return Message(
             id=event.get('client_msg_id', ''),
-            content=event.get('text', ''),
-            sender_id=event.get('user', ''),
-            sender_name=self._get_user_name(event.get('user', '')),
+            content=text,
+            sender_id=user_id,
+            sender_name=self._get_user_name(user_id),
             channel_id=event.get('channel', ''),
-            thread_id=event.get('thread_ts'),
+            thread_id=thread_ts,
             timestamp=float(event.get('ts', 0)),
             message_type=msg_type,
-            mentions=self._extract_mentions(event.get('text', ''))
+            mentions=self._extract_mentions(text) if has_mentions else []
         )
 
     def _get_user_name(self, user_id: str) -> str:
-        """Get user name from Slack API"""
+        """Get user name, from the resolver or cache before the Slack API"""
+        if not user_id:
+            return "Unknown User"
+        if self._user_name_resolver:
+            return self._user_name_resolver(user_id)
+
+        name = self._user_names.get(user_id)
+        if name is not None:
+            return name
         try:
-            if not user_id:
-                return "Unknown User"
             response = self.web_client.users_info(user=user_id)
             if response['ok']:
-                return response['user']['real_name']
+                name = response['user']['real_name']
+                self._user_names[user_id] = name
+                return name
             return "Unknown User"
         except Exception as e:
             self.logger.error(f"Error getting user name: {e}")
@@ -114,8 +169,7 @@ class SlackEventHandler:
 
     def _extract_mentions(self, text: str) -> List[str]:
         """Extract user mentions from message text"""
-        import re
-        return re.findall(r'<@([A-Z0-9]+)>', text or '')
+        return _MENTION_RE.findall(text) if text else []
 
     async def _handle_disconnect(self):
         """Handle disconnection and attempt reconnection"""
@@ -142,19 +196,28 @@ class SlackEventHandler:
 
     def on_message(self, handler: Callable[[Dict], Any]):
         """Register message event handler"""
-        self._message_handler = handler
+        self._handlers['message'] = handler
 
     def on_presence_change(self, handler: Callable[[Dict], Any]):
         """Register presence change handler"""
-        self._presence_handler = handler
+        self._handlers['presence_change'] = handler
 
     def on_status_change(self, handler: Callable[[Dict], Any]):
         """Register status change handler"""
-        self._status_handler = handler
+        self._handlers['user_status_changed'] = handler
+
+    def on_user_change(self, handler: Callable[[Dict], Any]):
+        """Register user profile change handler"""
+        self._handlers['user_change'] = handler
 
     async def stop(self):
         """Stop listening for events"""
         self._running = False
+        if self._drain_task:
+            self._drain_task.cancel()
+            self._drain_task = None
+        for task in list(self._dispatch_tasks):
+            task.cancel()
         if self.socket_client:
             self.socket_client.disconnect()
             self._connected = False
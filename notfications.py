@@ -1,7 +1,7 @@
 from flask import Flask, render_template, request, jsonify
-import asyncio
 import threading
 from easy_slack import EasySlack, NotificationPriority, NotifySound
+from easy_slack.utils import eventloop
 
 app = Flask(__name__)
 
@@ -48,7 +48,7 @@ def run_slack_bot(email):
         print("\nPress Ctrl+C to stop")
         await slack.start()
     
-    asyncio.run(main())
+    eventloop.run(main())
 
 @app.route('/')
 def home():
@@ -1,5 +1,6 @@
 from easy_slack import EasySlack, NotificationPriority, NotifySound, MessageType
-import asyncio
+from easy_slack.utils import eventloop
+
 #python -m easy_slack.cli.setup_cli
 async def main():
     slack = EasySlack()
@@ -42,6 +43,6 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        eventloop.run(main())
     except KeyboardInterrupt:
         print("\nShutting down...")